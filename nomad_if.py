@@ -10,10 +10,43 @@
 # - Device toggles and fuel consumption
 
 import yaml
-import re, os, sys, math, json, random
-import shutil, subprocess, sys
+import re, os, sys, math, json, random, heapq, bisect, array
+import shutil, subprocess, sys, contextlib, hashlib
+from collections import namedtuple
 from collections import defaultdict
 
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml when it's built in
+
+YAML_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "nomad_if")
+
+def load_yaml(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+def load_yaml_cached(path):
+    """A YAML document, via a JSON copy in YAML_CACHE_DIR named by the YAML's sha256.
+    Documents that don't survive a JSON round trip (non-str keys, dates) are just parsed."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    cache = os.path.join(YAML_CACHE_DIR, hashlib.sha256(raw).hexdigest() + ".json")
+    try:
+        with open(cache, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass  # missing or unreadable: reparse
+    data = yaml.load(raw, Loader=YAML_LOADER)
+    try:
+        text = json.dumps(data)
+        if json.loads(text) == data:
+            os.makedirs(YAML_CACHE_DIR, exist_ok=True)
+            tmp = f"{cache}.{os.getpid()}"  # batch workers may race; publish atomically
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, cache)
+    except (OSError, TypeError, ValueError):
+        pass  # no writable cache dir or not JSON-shaped; just parse next time
+    return data
+
 TURN_MINUTES = 10
 DAY_MINUTES  = 24 * 60
 SYSTEM_VOLTAGE = 12.0
@@ -42,11 +75,6 @@ def show_image(path, width_px=800):
 ## ---- Load site-local maps ----
 def load_local_maps(maps_root="data/maps"):
     import os, glob
-    try:
-        import yaml
-    except Exception:
-        print("(local maps) PyYAML not installed; skipping local maps.")
-        return {}
 
     maps = {}
     if not os.path.isdir(maps_root):
@@ -54,8 +82,7 @@ def load_local_maps(maps_root="data/maps"):
 
     for p in glob.glob(os.path.join(maps_root, "**", "*.y*ml"), recursive=True):
         try:
-            with open(p, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            data = load_yaml_cached(p) or {}
         except Exception as e:
             print(f"(local maps) Failed to load {p}: {e}")
             continue
@@ -75,55 +102,126 @@ def load_npcs():
     here = os.path.dirname(os.path.abspath(__file__))
     p = os.path.join(here, "npcs.yaml")
     if not os.path.exists(p): return {}
-    import yaml
-    with open(p, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+    raw = load_yaml_cached(p) or {}
     lst = raw.get("npcs", [])
     return {n["id"]: n for n in lst}
 
-def clamp(v, lo, hi): return max(lo, min(hi, v))
+def clamp(v, lo, hi): return lo if v < lo else hi if v > hi else v
+_EMPTY = {}  # shared read-only default for missing sub-dicts; never mutate
 
+_BAR_CACHE = {}  # (full, width) -> bar string
 def draw_bar(pct, width=20):
-    pct = clamp(pct, 0, 1)
-    full = int(round(pct*width))
-    return "[" + "█"*full + "·"*(width-full) + "]"
+    full = int(round(clamp(pct, 0, 1)*width))
+    bar = _BAR_CACHE.get((full, width))
+    if bar is None:
+        bar = _BAR_CACHE[(full, width)] = "[" + "█"*full + "·"*(width-full) + "]"
+    return bar
 
+_HHMM = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in range(DAY_MINUTES))  # minute of day -> "HH:MM"
 def minutes_to_hhmm(total_minutes):
-    d = total_minutes // DAY_MINUTES + 1
-    m = total_minutes % DAY_MINUTES
-    hh = m // 60
-    mm = m % 60
-    return f"Day {d} {hh:02d}:{mm:02d}"
+    d, m = divmod(total_minutes, DAY_MINUTES)
+    return f"Day {d + 1} {_HHMM[m]}"
+
+DAWN_MIN, DUSK_MIN = 6*60, 20*60  # daylight is 06:00–20:00
 
 def is_daylight(total_minutes):
-    m = total_minutes % DAY_MINUTES
-    return 6*60 <= m < 20*60  # 06:00–20:00
+    return DAWN_MIN <= total_minutes % DAY_MINUTES < DUSK_MIN
 
-def daylight_sine(total_minutes):
-    """0..1 bell centered midday, 0 at night; window 06:00..20:00 mapped to sin(pi*t)"""
-    m = total_minutes % DAY_MINUTES
+def _daylight_sine(m):
     if m < 360 or m > 1200: return 0.0
     t = (m - 360) / (1200 - 360)
     return max(0.0, math.sin(math.pi * t))
 
-def seeded_rng(*parts):
-    seed = 0xABCDEF
+SUN_TABLE = tuple(_daylight_sine(m) for m in range(DAY_MINUTES))  # minute-of-day -> sine
+
+def daylight_sine(total_minutes):
+    """0..1 bell centered midday, 0 at night; window 06:00..20:00 mapped to sin(pi*t)"""
+    return SUN_TABLE[total_minutes % DAY_MINUTES]
+
+def trickle_step(battery, ev_battery, solar_ev, wind_house, wind_ev):
+    """One tick of passive solar/wind trickle. Plain floats in and out; the
+    caller resolves site quality and weather beforehand."""
+    # clamp(), inlined: this runs every tick of work and hiking
+    ev = ev_battery + solar_ev
+    ev = 100 if ev > 100 else 0 if ev < 0 else ev
+    b = battery + wind_house
+    ev += wind_ev
+    return (100 if b > 100 else 0 if b < 0 else b), (100 if ev > 100 else 0 if ev < 0 else ev)
+
+# Stateless draws for callers that need one or two numbers; no Random object.
+MASK64 = (1 << 64) - 1
+
+def splitmix64(x):
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+_DRAW_SEED = 0  # folded into every mix_hash; set by set_draw_seed()
+_PART_HASH = {}  # non-int part -> 64-bit digest of its str(); ids and tags repeat constantly
+def _part_hash(p):
+    """hash() of a str is salted per process; this is the same in every process."""
+    if type(p) is int: return p & MASK64
+    h = _PART_HASH.get(p)
+    if h is None:
+        h = _PART_HASH[p] = int.from_bytes(hashlib.blake2b(str(p).encode(), digest_size=8).digest(), 'little')
+    return h
+
+def mix_hash(*parts):
+    """64-bit hash of parts under the current draw seed; same seed and parts
+    give the same value in every run."""
+    h = _DRAW_SEED
     for p in parts:
-        seed ^= hash(p) & 0xFFFFFFFF
-        seed = (seed * 1664525 + 1013904223) & 0xFFFFFFFF
-    return random.Random(seed)
+        h = splitmix64(h ^ _part_hash(p))
+    return h
+
+def set_draw_seed(seed):
+    """Key every mix_* draw to seed: one seed replays the same game, another plays
+    a different one. Forgets per-(node, day) draws memoized under the old seed."""
+    global _DRAW_SEED
+    _DRAW_SEED = splitmix64(_part_hash(seed))
+    _WEATHER_DRAWS.clear(); _WEATHER_DAY.clear(); _SIGNAL_DRAWS.clear()
+
+def mix_float(*parts):
+    """Uniform float in [0, 1) keyed by parts."""
+    return (mix_hash(*parts) >> 11) * (1.0 / (1 << 53))
+
+def mix_uniform(lo, hi, *parts):
+    """Uniform float in [lo, hi) keyed by parts."""
+    return lo + (hi - lo) * mix_float(*parts)
+
+def mix_int(lo, hi, *parts):
+    """Integer in [lo, hi] keyed by parts."""
+    return lo + mix_hash(*parts) % (hi - lo + 1)
+
+def mix_triangular(lo, hi, mode, *parts):
+    """random.triangular(lo, hi, mode), keyed by parts."""
+    u = mix_float(*parts)
+    c = (mode - lo) / (hi - lo)
+    if u > c:
+        u, c, lo, hi = 1.0 - u, 1.0 - c, hi, lo
+    return lo + (hi - lo) * math.sqrt(u * c)
+
+def mix_choice(seq, cdf, *parts):
+    """Pick from seq by a precomputed cumulative distribution (ending at 1.0)."""
+    return seq[bisect.bisect_right(cdf, mix_float(*parts))]
 
 # ---------------------------- Archetypes ------------------------------
 
-with open("vehicles.yaml", "r", encoding="utf-8") as f:
-    VEHICLES = yaml.safe_load(f)
+VEHICLES = load_yaml("vehicles.yaml")  # parsed, not cached: importing writes nothing
+JOBS     = load_yaml("jobs.yaml")
 
-with open("jobs.yaml", "r", encoding="utf-8") as f:
-    JOBS = yaml.safe_load(f)
+# Job perks as fixed fields; a job that doesn't list one gets the neutral default
+Perks = namedtuple('Perks', 'epic_bonus shop_discount remote_camp_income hike_energy_mult '
+                            'hike_find_bonus morale_bonus_dispersed morale_multiplier',
+                   defaults=(0.0, 0.0, 0, 1.0, 0.0, 0, 0.0))
+NO_PERKS = Perks()
+JOB_PERKS = {k: Perks(**{f: v for f, v in (j or {}).items() if f in Perks._fields}) for k, j in JOBS.items()}
 
 # ---------------------------- Seasons (YAML) --------------------------
 
 SEASONS = None  # list of tuples: [(name, days, meta), ...]
+_SEASON_OF_DAY = None  # day of the year -> (name, meta), built from SEASONS on first use
 REF_ELEV_FT = 4000.0
 LAPSE_F_PER_KFT = -3.5  # ambient temp lapse vs reference per 1000 ft
 
@@ -147,10 +245,9 @@ def load_seasons():
     ]
     if not os.path.exists(p):
         return default
+    default_by_name = {name: (span, meta) for name, span, meta in default}
     try:
-        import yaml
-        with open(p, "r", encoding="utf-8") as f:
-            raw = yaml.safe_load(f)
+        raw = load_yaml_cached(p)
         if not isinstance(raw, dict):
             return default
         out = []
@@ -158,7 +255,7 @@ def load_seasons():
             val = raw.get(name)
             if val is None:
                 # if missing, use default
-                out.append([x for x in default if x[0]==name][0]); continue
+                out.append((name, *default_by_name[name])); continue
             span = None; meta = {}
             if isinstance(val, dict):
                 # case A: {'days': 90, 'diurnal_amp':..., ...}
@@ -183,9 +280,9 @@ def load_seasons():
                 meta = merge_list_of_maps(val)
             # fallback span if still unknown
             if span is None:
-                span = [x for x in default if x[0]==name][0][1]
+                span = default_by_name[name][0]
             # ensure required keys exist
-            dmeta = [x for x in default if x[0]==name][0][2]
+            dmeta = default_by_name[name][1]
             for k, dv in dmeta.items():
                 meta.setdefault(k, dv)
             out.append((name, span, meta))
@@ -195,173 +292,316 @@ def load_seasons():
 
 def get_season(total_minutes):
     """Return (season_name, meta) for the current in-game day."""
-    global SEASONS
-    if SEASONS is None:
-        SEASONS = load_seasons()
-    total_days = sum(span for _, span, _ in SEASONS)
-    day_index = (total_minutes // DAY_MINUTES) % total_days + 1
-    acc = 0
-    for name, span, meta in SEASONS:
-        acc += span
-        if day_index <= acc:
-            return name, meta
-    # fallback
-    name, _, meta = SEASONS[-1]
-    return name, meta
+    global SEASONS, _SEASON_OF_DAY
+    if _SEASON_OF_DAY is None:
+        if SEASONS is None:
+            SEASONS = load_seasons()
+        _SEASON_OF_DAY = []
+        for name, span, meta in SEASONS:
+            _SEASON_OF_DAY.extend([(name, meta)] * span)
+    return _SEASON_OF_DAY[(total_minutes // DAY_MINUTES) % len(_SEASON_OF_DAY)]
 
 # ---------------------------- World -----------------------------------
 
 class World:
     def __init__(self, nodes):
+        # ids are hashed and compared constantly (caches, routing); share one string per id
+        for n in nodes:
+            n['id'] = sys.intern(n['id'])
+            for c in n.get('connections', []): c['to'] = sys.intern(c['to'])
         self.nodes = {n['id']: n for n in nodes}
         self._ensure_bidirectional()
+        self._precompute()
+        self._edge_turns_cache = {}  # (edge index, weather speed mod) -> turns
+        self._out_turns_cache = {}   # (node index, weather speed mod) -> out_turns row
+        self._tree_cache = {}        # (source index, departure minute) -> dijkstra_tree result
+
+    def _precompute(self):
+        """Resolve per-edge road speed and per-node solar site factors once,
+        and lay the graph out as integer-indexed arrays (CSR) for routing."""
+        self.node_ids = list(self.nodes)
+        self.node_index = {nid: i for i, nid in enumerate(self.node_ids)}
+        self.node_list = [self.nodes[nid] for nid in self.node_ids]  # node dicts by index
+        self.adj_offsets = array.array('i', [0])  # edges of node i: adj_offsets[i]:adj_offsets[i+1]
+        self.adj_sources = array.array('i')
+        self.adj_targets = array.array('i')
+        self.adj_speed   = array.array('d')       # road x grade base speed, before weather
+        self.adj_miles   = array.array('d')
+        self.adj_conns   = []                     # the connection dicts, for route output
+        # find_node lookups: exact lowercase name (first wins), then substring scan
+        self._search_names = [(nid, self.nodes[nid].get('name','').lower()) for nid in self.node_ids]
+        self._name_to_id = {}
+        for nid, name_l in self._search_names: self._name_to_id.setdefault(name_l, nid)
+        self._find_cache = {}
+        for i, nid in enumerate(self.node_ids):
+            node = self.nodes[nid]
+            sol = (node.get('resources') or _EMPTY).get('solar', 'fair')
+            node['_solar_site'] = SOLAR_SITE.get(sol, 0.5)   # EV trickle
+            node['_panel_site'] = PANEL_SITE.get(sol, 0.5)   # house panels
+            biome = (node.get('biome') or '').lower()
+            node['_biome_tags'] = frozenset(k for k in BIOME_KEYWORDS if k in biome)
+            node['_remote'] = any(k in biome for k in REMOTE_BIOMES)
+            node['_scroungers'] = any(k in biome for k in SCROUNGER_BIOMES)
+            node['_in_park'] = nid in NATIONAL_PARKS
+            for c in node.get('connections', []):
+                if c['to'] not in self.node_index: continue
+                c['_edge'] = len(self.adj_conns)
+                self.adj_sources.append(i)
+                self.adj_targets.append(self.node_index[c['to']])
+                self.adj_speed.append(BASE_SPEED.get(c.get('road','mixed'), 40.0) * GRADE_MOD.get(c.get('grade','mixed'), 0.90))
+                self.adj_miles.append(float(c.get('miles', 10)))
+                self.adj_conns.append(c)
+            self.adj_offsets.append(len(self.adj_conns))
+
+    def edge_turns(self, e, mod):
+        """Turns to drive edge e given the start node's weather speed modifier."""
+        key = (e, mod)
+        turns = self._edge_turns_cache.get(key)
+        if turns is None:
+            speed = max(15.0, self.adj_speed[e] * mod)
+            hours = self.adj_miles[e] / speed
+            turns = self._edge_turns_cache[key] = max(1, math.ceil(hours * 60 / TURN_MINUTES))
+        return turns
+
+    def out_turns(self, u, mod):
+        """(edge, target, turns) for every edge leaving node index u under mod,
+        built once per (u, mod) so relaxation is a plain walk over a tuple."""
+        key = (u, mod)
+        row = self._out_turns_cache.get(key)
+        if row is None:
+            targets = self.adj_targets
+            row = self._out_turns_cache[key] = tuple(
+                (e, targets[e], self.edge_turns(e, mod)) for e in range(self.adj_offsets[u], self.adj_offsets[u+1]))
+        return row
+
+    def shortest_tree(self, s, total_minutes):
+        """dijkstra_tree from node index s, shared by every destination queried
+        from there at that minute. Edge weights follow the diurnal heat curve,
+        so the key is the exact departure minute, not an hour or day bucket."""
+        key = (s, total_minutes)
+        tree = self._tree_cache.get(key)
+        if tree is None:
+            if len(self._tree_cache) >= 256: self._tree_cache.clear()  # clock only moves forward
+            tree = self._tree_cache[key] = dijkstra_tree(self, s, total_minutes)
+        return tree
 
     def _ensure_bidirectional(self):
+        existing = {(nid, c['to']) for nid, node in self.nodes.items()
+                    for c in node.get('connections', [])}
         for nid, node in self.nodes.items():
             for c in node.get('connections', []):
                 other = c['to']
-                if other not in self.nodes:
+                if other not in self.nodes or (other, nid) in existing:
                     continue
-                back = None
-                for bc in self.nodes[other].get('connections', []):
-                    if bc['to'] == nid:
-                        back = bc; break
-                if not back:
-                    rev = dict(c); rev['to'] = nid
-                    self.nodes[other].setdefault('connections', []).append(rev)
+                rev = dict(c); rev['to'] = nid
+                self.nodes[other].setdefault('connections', []).append(rev)
+                existing.add((other, nid))
 
     def find_node(self, key):
         key_l = key.strip().lower()
-        if key_l in self.nodes: return key_l
-        for nid, n in self.nodes.items():
-            if n.get('name','').lower() == key_l: return nid
-        for nid, n in self.nodes.items():
-            if key_l in nid or key_l in n.get('name','').lower():
-                return nid
-        return None
+        if key_l in self._find_cache: return self._find_cache[key_l]
+        nid = key_l if key_l in self.nodes else self._name_to_id.get(key_l)
+        if nid is None:
+            nid = next((i for i, name_l in self._search_names if key_l in i or key_l in name_l), None)
+        self._find_cache[key_l] = nid  # misses too; the node set never changes
+        return nid
 
 # ---- Time windows & helpers ----
 
-def current_time_windows(total_minutes, node):
-    m = total_minutes % DAY_MINUTES
-    w = derive_weather(node, total_minutes)
+def _window_tags(m):
+    """Weather-independent time-window tags for minute-of-day m."""
     tags = set()
     if 330 <= m <= 450: tags.add("sunrise"); tags.add("golden_hour")
     if 360 <= m <= 480: tags.add("golden_hour")
     if 420 <= m <= 660: tags.add("morning"); tags.add("daylight")
     if 660 < m < 1110: tags.add("daylight")
     if 1110 <= m <= 1200: tags.add("golden_hour"); tags.add("daylight")
-    if not (360 <= m < 1200):
-        tags.add("night")
-        if (not w['monsoon']) and (w['wind'] != 'high') and (not w['flood_watch']):
-            tags.add("night_clear")
-    return tags, w
+    if not (360 <= m < 1200): tags.add("night")
+    return frozenset(tags)
+
+# Per minute-of-day lookup; the *_CLEAR table adds night_clear to night slots.
+_interned_tags = {}
+WINDOW_TAGS = tuple(_interned_tags.setdefault(t, t) for t in map(_window_tags, range(DAY_MINUTES)))
+WINDOW_TAGS_CLEAR = tuple(_interned_tags.setdefault(t, t) for t in
+                          (t | {"night_clear"} if "night" in t else t for t in WINDOW_TAGS))
+del _interned_tags
+
+def time_windows(total_minutes, node):
+    """Time-window tags here and now. Whether the night counts as clear rests on
+    the day's wind/monsoon/flood draws only, so no full derive_weather is needed."""
+    wind, _, monsoon, flood_watch = _weather_draws(node, total_minutes // DAY_MINUTES + 1)
+    m = total_minutes % DAY_MINUTES
+    if (not monsoon) and (wind != 'high') and (not flood_watch):
+        return WINDOW_TAGS_CLEAR[m]
+    return WINDOW_TAGS[m]
+
+WINDOW_MULT = {"sunrise":1.6,"golden_hour":1.5,"morning":1.15,"daylight":1.0,"night":0.9,"night_clear":1.4}
 
 def window_multiplier(tag, windows):
     if tag not in windows: return 0.6
-    return {"sunrise":1.6,"golden_hour":1.5,"morning":1.15,"daylight":1.0,"night":0.9,"night_clear":1.4}.get(tag,1.0)
+    return WINDOW_MULT.get(tag, 1.0)
 
 # ---------------------------- Weather ---------------------------------
 
+WIND_LEVELS = ('low','medium','high')
+WIND_CDF    = (4/9, 7/9, 1.0)  # weights 4:3:2
+WIND_HOUSE  = {'low':0.0,'medium':0.8,'high':1.5}  # house-battery trickle per wind class
+WIND_EV     = {'low':0.2,'medium':0.6,'high':1.0}  # EV trickle per wind class
+WIND_TURBINE_FRAC = {'low':0.1,'medium':0.4,'high':8.0}  # turbine output per rated watt
+HEAT_WATER_MULT   = {'cold':0.9, 'mild':1.0, 'hot':1.2, 'very_hot':1.35}
+
+_WEATHER_DRAWS = {}  # (node_id, day) -> (wind, humidity jitter, monsoon, flood_watch)
+
+def _weather_draws(node, day):
+    """Random part of the weather; seeded per (node, day), so memoized."""
+    key = (node['id'], day)
+    draws = _WEATHER_DRAWS.get(key)
+    if draws is None:
+        nid = node['id']
+        wind = mix_choice(WIND_LEVELS, WIND_CDF, nid, day, 'wind')
+        jitter = -5 + 10 * mix_float(nid, day, 'humidity')
+        season_rules = " ".join(node.get('season_rules', [])).lower()
+        monsoon = ('monsoon' in season_rules) and mix_float(nid, day, 'monsoon') < 0.20
+        flood_watch = (('flash_flood' in season_rules) or ('monsoon' in season_rules)) and mix_float(nid, day, 'flood') < 0.12
+        draws = _WEATHER_DRAWS[key] = (wind, jitter, monsoon, flood_watch)
+    return draws
+
+_WEATHER_DAY = {}  # (node_id, day) -> the parts of derive_weather fixed for that day
+
+def _weather_day(node, day):
+    """Season, site and random terms of the weather that only change at midnight."""
+    key = (node['id'], day)
+    base = _WEATHER_DAY.get(key)
+    if base is None:
+        wind, jitter, monsoon, flood_watch = _weather_draws(node, day)
+        season_name, meta = get_season((day - 1) * DAY_MINUTES)
+        # Site elevation effect
+        elev = float(node.get('elevation_ft', REF_ELEV_FT))
+        lapse = (elev - REF_ELEV_FT)/1000.0 * LAPSE_F_PER_KFT
+        base = _WEATHER_DAY[key] = (
+            season_name, float(meta.get("uv_peak", 8.0)),
+            float(meta.get("temp_base", 70.0)) + lapse, float(meta.get("diurnal_amp", 15.0)),
+            float(meta.get("humidity_base", 30.0)) + jitter, wind, monsoon, flood_watch)
+    return base
+
+_SIGNAL_DRAWS = {}  # (node_id, day) -> whether there's cell/data coverage for remote work
+
+def signal_today(node, day):
+    """Daily coverage roll without Starlink: near-certain in towns, a coin flip elsewhere."""
+    key = (node['id'], day)
+    ok = _SIGNAL_DRAWS.get(key)
+    if ok is None:
+        odds = 0.95 if 'town' in node['_biome_tags'] else 0.55
+        ok = _SIGNAL_DRAWS[key] = mix_float(node['id'], day, 'signal') < odds
+    return ok
+
+Weather = namedtuple('Weather', 'heat wind monsoon flood_watch temp_f humidity uv season')
+
 def derive_weather(node, total_minutes):
     """Stochastic-but-seasonal weather with numeric temp/humidity/UV."""
-    day = total_minutes // DAY_MINUTES + 1
-    rng = seeded_rng(node['id'], day)
-
-    # Season & diurnal
-    season_name, meta = get_season(total_minutes)
-    uv_peak = float(meta.get("uv_peak", 8.0))
-    temp_base = float(meta.get("temp_base", 70.0))
-    diurnal_amp = float(meta.get("diurnal_amp", 15.0))
-    humidity_base = float(meta.get("humidity_base", 30.0))
-
-    # Wind category
-    wind = rng.choices(['low','medium','high'], weights=[4,3,2])[0]
-
-    # Site elevation effect
-    elev = float(node.get('elevation_ft', REF_ELEV_FT))
-    lapse = (elev - REF_ELEV_FT)/1000.0 * LAPSE_F_PER_KFT
+    season_name, uv_peak, temp_mid, diurnal_amp, humid_mid, wind, monsoon, flood_watch = \
+        _weather_day(node, total_minutes // DAY_MINUTES + 1)
 
     # Diurnal variation (colder nights, hotter days)
     diel = daylight_sine(total_minutes)  # 0..1
-    temp = temp_base + lapse + (diurnal_amp * (diel*2 - 1))  # swing around base
-    temp = round(temp, 1)
-
-    # Humidity jitter
-    humid = clamp(humidity_base + rng.uniform(-5, 5) - 8*(diel), 5, 95)
-
-    # UV index
+    temp = round(temp_mid + (diurnal_amp * (diel*2 - 1)), 1)  # swing around base
+    humid = clamp(humid_mid - 8*(diel), 5, 95)
     uv = round(uv_peak * diel, 1)
 
-    # Monsoon / flood watch by node rules
-    season_rules = " ".join(node.get('season_rules', [])).lower()
-    monsoon = ('monsoon' in season_rules) and rng.random() < 0.20
-    flood_watch = (('flash_flood' in season_rules) or ('monsoon' in season_rules)) and rng.random() < 0.12
+    return Weather('hot' if temp>=85 else 'mild' if temp>=55 else 'cold',
+                   wind, monsoon, flood_watch, temp, round(humid,1), uv, season_name)
 
-    return {'heat': ('hot' if temp>=85 else 'mild' if temp>=55 else 'cold'),
-            'wind': wind, 'monsoon': monsoon, 'flood_watch': flood_watch,
-            'temp_f': temp, 'humidity': round(humid,1), 'uv': uv, 'season': season_name}
+_UV_FRACTION = {}  # (uv_peak, floor) -> uv_fraction by minute of day
+def uv_fraction(total_minutes, floor=1.0):
+    """derive_weather's UV over the season's peak (0..1); no per-node work needed."""
+    uv_peak = get_season(total_minutes)[1].get("uv_peak", 8.0)
+    table = _UV_FRACTION.get((uv_peak, floor))
+    if table is None:
+        # a handful of seasons x two floors: one day's curve each, built on first use
+        table = _UV_FRACTION[(uv_peak, floor)] = tuple(
+            clamp(round(float(uv_peak) * sine, 1) / max(floor, uv_peak), 0, 1) for sine in SUN_TABLE)
+    return table[total_minutes % DAY_MINUTES]
 
 def weather_speed_mod(w):
     mod = 1.0
-    if w['heat'] == 'hot': mod *= 0.95
-    if w['wind'] == 'high': mod *= 0.92
-    if w['flood_watch']: mod *= 0.90
+    if w.heat == 'hot': mod *= 0.95
+    if w.wind == 'high': mod *= 0.92
+    if w.flood_watch: mod *= 0.90
     return mod
 
+HEAT_DESC = {'cold':"cold",'mild':"mild",'hot':"hot"}
+WIND_DESC = {'low':"light winds",'medium':"breezy",'high':"windy"}
+
 def describe_weather(w):
-    base = {'cold':"cold",'mild':"mild",'hot':"hot"}[w['heat']]
-    wind = {'low':"light winds",'medium':"breezy",'high':"windy"}[w['wind']]
+    base = HEAT_DESC[w.heat]
+    wind = WIND_DESC[w.wind]
     extra = []
-    if w['monsoon']: extra.append("monsoon cells around")
-    if w['flood_watch']: extra.append("flash-flood watch")
-    return f"{base}, {wind}, {w['temp_f']}°F, {w['humidity']}% RH, UV {w['uv']}" + ("" if not extra else f" ({', '.join(extra)})")
+    if w.monsoon: extra.append("monsoon cells around")
+    if w.flood_watch: extra.append("flash-flood watch")
+    return f"{base}, {wind}, {w.temp_f}°F, {w.humidity}% RH, UV {w.uv}" + ("" if not extra else f" ({', '.join(extra)})")
 
 # ---------------------------- Travel ----------------------------------
 
 BASE_SPEED = {'interstate':70.0,'highway':60.0,'scenic':55.0,'mixed':40.0,'gravel':30.0,'trail':10.0}
 GRADE_MOD  = {'flat':1.00,'light':0.95,'moderate':0.85,'mixed':0.90,'steep':0.70}
+ROAD_XP    = {'interstate':0.25,'highway':0.3,'scenic':0.4,'mixed':0.35,'gravel':0.6,'trail':1.0}  # XP per mile
+GRADE_XP   = {'flat':1.0,'light':1.05,'moderate':1.15,'mixed':1.1,'steep':1.3}
+
+# Solar site quality -> output factor (EV trickle charging vs. house panels)
+SOLAR_SITE = {'excellent':1.0,'good':0.75,'fair':0.5,'poor':0.25}
+PANEL_SITE = {'excellent':0.9,'good':0.70,'fair':0.40,'poor':0.20, 'terrible':0.5}
+
+# Keywords matched inside biome names ('desert' covers high_desert, mesa_desert, ...);
+# World tags each node with the ones its biome contains.
+BIOME_KEYWORDS = ('arches','canyon','desert','salt','alpine','town','mesa','swell')
+REMOTE_BIOMES    = ('desert','swell','salt','mesa','canyon')                   # patchy signal when camping
+SCROUNGER_BIOMES = ('mesa_desert','high_desert','alpine','town_desert')        # more rodents at camp
+
+# Switchable 12V loads summed by _load_amps_now (the heater is handled apart: it also needs diesel)
+LOAD_DEVICES = ('fridge','starlink','weboost','laptop')
 
 def edge_drive_turns(world, start_node_id, conn, total_minutes):
     node = world.nodes[start_node_id]
     w = derive_weather(node, total_minutes)
-    speed = BASE_SPEED.get(conn.get('road','mixed'), 40.0)
-    speed *= GRADE_MOD.get(conn.get('grade','mixed'), 0.90)
-    speed *= weather_speed_mod(w)
-    speed = max(15.0, speed)
-    miles = float(conn.get('miles', 10))
-    hours = miles / speed
-    turns = max(1, math.ceil(hours * 60 / TURN_MINUTES))
-    return turns, w
+    return world.edge_turns(conn['_edge'], weather_speed_mod(w)), w
+
+def dijkstra_tree(world, s, total_minutes):
+    """Full shortest-turns tree from node index s: (dist, prev edge) lists."""
+    n = len(world.node_ids)
+    dist = [math.inf] * n
+    prev = [None] * n  # edge index used to reach each node
+    dist[s] = 0
+    heap = [(0, s)]  # no decrease-key: an entry is stale once dist[u] has improved past it
+    heappop, heappush = heapq.heappop, heapq.heappush
+    nodes, out_turns = world.node_list, world.out_turns
+    while heap:
+        cur_dist, u = heappop(heap)
+        if cur_dist > dist[u]: continue
+        # every edge out of u departs at the same time, so share its weather
+        mod = weather_speed_mod(derive_weather(nodes[u], total_minutes + cur_dist*TURN_MINUTES))
+        for e, v, turns in out_turns(u, mod):
+            nd = cur_dist + turns
+            if nd < dist[v]:
+                dist[v] = nd
+                prev[v] = e
+                heappush(heap, (nd, v))
+    return dist, prev
 
 def dijkstra_route(world, src, dst, total_minutes):
-    dist = {nid: math.inf for nid in world.nodes}
-    prev = {nid: None for nid in world.nodes}
-    dist[src] = 0
-    visited = set()
-    while True:
-        cur, cur_dist = None, math.inf
-        for nid, d in dist.items():
-            if nid in visited: continue
-            if d < cur_dist: cur, cur_dist = nid, d
-        if cur is None or cur == dst: break
-        visited.add(cur)
-        for c in world.nodes[cur].get('connections', []):
-            turns, _ = edge_drive_turns(world, cur, c, total_minutes + dist[cur]*TURN_MINUTES)
-            nd = dist[cur] + turns
-            if nd < dist[c['to']]:
-                dist[c['to']] = nd
-                prev[c['to']] = (cur, c)
-    if dist[dst] == math.inf: return None, None
+    ids = world.node_ids
+    s, t = world.node_index[src], world.node_index[dst]
+    dist, prev = world.shortest_tree(s, total_minutes)
+    if dist[t] == math.inf: return None, None
     path = []
-    nid = dst
-    while nid != src:
-        p = prev[nid]
-        if not p: break
-        path.append((p[0], nid, p[1]))
-        nid = p[0]
+    v = t
+    while v != s:
+        e = prev[v]
+        if e is None: break
+        u = world.adj_sources[e]
+        path.append((ids[u], ids[v], world.adj_conns[e]))
+        v = u
     path.reverse()
-    return path, dist[dst]
+    return path, dist[t]
 
 # ---------------------------- Items (YAML) ----------------------------
 
@@ -372,9 +612,7 @@ def load_items_catalog():
     catalog = {}
     if os.path.exists(p):
         try:
-            import yaml
-            with open(p, "r", encoding="utf-8") as f:
-                raw = yaml.safe_load(f) or {}
+            raw = load_yaml_cached(p) or {}
             items = raw.get("items") if isinstance(raw, dict) else raw
             if isinstance(items, dict):
                 for k, v in items.items():
@@ -399,7 +637,10 @@ def xp_needed_for_level(level):
     return int(500 * (level-1) ** 1.35 + 0.5)
 
 def level_from_xp(xp):
-    lvl = 1
+    # invert the curve, then nudge past the int() rounding in xp_needed_for_level
+    lvl = int((xp / 500) ** (1 / 1.35)) + 1 if xp > 0 else 1
+    while lvl > 1 and xp < xp_needed_for_level(lvl):
+        lvl -= 1
     while xp >= xp_needed_for_level(lvl+1):
         lvl += 1
     return lvl
@@ -407,6 +648,8 @@ def level_from_xp(xp):
 # ---------------------------- Pets ------------------------------------
 
 class Pet:
+    __slots__ = ('name', 'breed', 'bond', 'energy', 'obedience', 'paw', 'alert', 'guard_mode')
+
     def __init__(self, name, breed):
         self.name = name
         self.breed = breed
@@ -418,23 +661,81 @@ class Pet:
         self.guard_mode = False
 
     def tick(self, minutes):
-        self.energy = clamp(self.energy - (minutes/60)*2, 0, 100)
+        e = self.energy - (minutes/60)*2
+        self.energy = 100 if e > 100 else 0 if e < 0 else e  # clamp(), inlined
+
+# adoption flavour: kind -> (breeds, names, spirits, actions)
+PET_TRAITS = {
+    'dog': (("French Bulldog","Golden Retriever","Labrador Retriever","Rottweiler","Beagle","Bulldog","Poodle","Dachsund","German Shorthair Pointer","German Shepherd","Shih Tzu","Terrier","Golden Doodle","Australian Sheepdog"),
+            ("Oreo","Mesa","Juniper","Pixel","Bowie","Zion","Havasu","Spot","Flash","The Dude","Max","Scooter"),
+            ("spirited","lazy","young","overweight","timid","large","small","playful","youthful","energetic"),
+            ("licks your face","claims your passenger seat","looks at you with big brown eyes","wags their tail","barks excitedly")),
+    'cat': (("Siamese","Persian","Maine Coon","Ragdoll","Sphynx","American Shorthair","Burmese","British Shorthair","Longhair","Bobtail"),
+            ("Swazi","Whiskers","Patches","Satan","Grouchy Pants","Moo","Olaf","Chandler","Joey","Monica","Ross","Phoebe","Rachael"),
+            ("spirited","lazy","young","overweight","timid","large","small","playful","youthful","energetic"),
+            ("disappears into the back of your vehicle","makes their way onto the dash","winds between your legs","meows hungrily")),
+}
+PET_KINDS = tuple(PET_TRAITS)
 
 # ---------------------------- Game State ------------------------------
 
+CAMP_XP       = {'paid':10,'stealth':15,'dispersed':18}
+CAMP_STYLES   = frozenset(CAMP_XP)
+DRIVE_MODES   = frozenset({'electric','fuel'})
+CHARGE_METHODS = frozenset({'station','solar','wind','generator'})
+NATIONAL_PARKS = frozenset({'zion','bryce','arches','canyonlands','capitol_reef'})
+SHOP_TOWNS    = frozenset({'moab','green_river','bryce'})
+JOB_WORK_KIND = {'photographer':'photo','remote_dev':'dev','mechanic':'mechanic','trail_guide':'guide','artist':'artist'}
+
+# Pre-purchase refusals: (effect key, "already full" test, message)
+BUY_CAPS = (
+    ("solar_watts",      lambda g: g.solar_watts >= g.solar_cap_watts,       "You're already at max solar wattage"),
+    ("wind_watts",       lambda g: g.wind_watts >= g.wind_cap_watts,         "You're already at max wind wattage"),
+    ("has_tent",         lambda g: g.has_tent,                               "You already own a tent."),
+    ("gasoline_can_gal", lambda g: g.gasoline_can_gal > g.gasoline_can_cap,  "You're already at max extra gasoline."),
+    ("diesel_can_gal",   lambda g: g.diesel_can_gal > g.diesel_can_cap,      "You're already at max extra diesel."),
+)
+
 class Game:
+    __slots__ = (
+        'world', 'location', 'minutes', '_weather_cache', '_rng',
+        'player_name', 'vehicle_type', 'vehicle_color', 'job', 'perks', 'mode', 'interactive',
+        'pet', 'pet_name', 'pet_type', 'vehicle_label', 'job_label',
+        'water_cap_gallons', 'food_cap_rations', 'max_water_cap', 'max_food_cap',
+        'house_cap', 'house_cap_ah', 'solar_cap_watts', 'wind_cap_watts',
+        'solar_watts', 'wind_watts', 'has_tent', 'battery',
+        'energy', 'morale', 'comfort', 'health', 'confidence', 'creativity', 'food', 'water',
+        'has_repair_manual', 'has_guitar', 'has_camera', 'has_deluxe_tent', 'has_laptop',
+        'cash', 'xp', 'level', 'route', 'route_idx',
+        'odometer', 'gasoline_can_gal', 'gasoline_can_cap', 'ev_range_mi', 'ev_battery',
+        'fuel_tank_gal', 'fuel_gal', 'mpg', 'diesel_can_gal', 'diesel_can_cap',
+        'propane_lb', 'propane_lb_cap', 'butane_can', 'butane_can_cap',
+        'last_camp_node', 'camp_nights_here', 'work_hours_day', 'work_hours_today',
+        'achievements', 'base_draw_amps', 'devices',
+        'dev_heater', 'dev_fridge', 'dev_starlink', 'dev_stove', 'dev_jetboil', 'dev_mousetrap', 'dev_generator',
+        '_amps_dirty', '_amps_cached', 'catalog', 'npcs', 'npc_state',
+        'in_local', 'local_maps', 'local_map_id', 'local_room_id',
+    )
+
     def __init__(self, world, config, catalog, npcs=None):
         self.world = world
         self.location = 'moab' if 'moab' in world.nodes else next(iter(world.nodes.keys()))
         self.minutes = 6*60  # start Day 1 morning
+        self._weather_cache = {}  # (location, minutes) -> derive_weather Weather
+        seed = config.get("seed")
+        if seed is None: seed = random.getrandbits(64)  # unseeded: a fresh game each launch
+        self._rng = random.Random(seed)  # game-local draws
+        set_draw_seed(seed)        # and every mix_* draw (weather, pay, rolls) follows the same seed
+        world._tree_cache.clear()  # routes cached under another seed's weather
 
         # Player & role
         self.player_name   = config.get("name", "Traveler")
         self.vehicle_type  = config.get("vehicle_key", "van")
         self.vehicle_color = config.get("color", "white")
         self.job           = config.get("job_key", "photographer")
-        self.job_perks     = JOBS.get(self.job, {})
+        self.perks         = JOB_PERKS.get(self.job, NO_PERKS)
         self.mode          = config.get("mode", "electric")
+        self.interactive   = config.get("interactive", True)  # False: no ENTER pauses / screen clears
 
         # Pet
         self.pet = None
@@ -443,6 +744,8 @@ class Game:
 
         # Vehicle archetype
         v = VEHICLES[self.vehicle_type]
+        self.vehicle_label    = v["label"]
+        self.job_label        = JOBS[self.job]["label"]
         self.water_cap_gallons = v["base_water_cap"]
         self.food_cap_rations = v["base_food_cap"]
         self.max_water_cap    = v["max_water_cap"]
@@ -461,8 +764,8 @@ class Game:
         self.battery = 75.0
 
         # heat drains more water
-        w = derive_weather(self.node(), self.minutes)
-        heat_mult = {'cold':0.9, 'mild':1.0, 'hot':1.2, 'very_hot':1.35}[w['heat']]
+        w = self.weather()
+        heat_mult = HEAT_WATER_MULT[w.heat]
 
         # Stats (pending integration)
         self.energy     = 80.0
@@ -516,8 +819,7 @@ class Game:
 
         # Work tracking
         self.work_hours_day = -1
-        self.work_hours_today = {}
-        self.gig_cooldowns = {}
+        self.work_hours_today = {}  # kind -> hours worked on work_hours_day
 
         # Achievements (pending)
         self.achievements = {
@@ -543,6 +845,13 @@ class Game:
             'mousetrap': {'owned': False},
             'generator': {'owned': False, 'on': False, 'charge_amps': 16.67, 'burn_gph': 0.15, 'fuel': 'diesel'},
         }
+        # direct handles on the hot device dicts (the dicts are mutated in place, never replaced)
+        d = self.devices
+        self.dev_heater, self.dev_fridge, self.dev_starlink = d['heater'], d['fridge'], d['starlink']
+        self.dev_stove, self.dev_jetboil, self.dev_mousetrap = d['stove'], d['jetboil'], d['mousetrap']
+        self.dev_generator = d['generator']
+        self._amps_dirty = True   # set whenever a device is bought, toggled or re-rated
+        self._amps_cached = None  # (load amps without heater, heater amps or None)
         self.diesel_can_gal = 0.0
         self.diesel_can_cap = v["diesel_can_cap"]
         self.propane_lb     = 0.0
@@ -581,19 +890,19 @@ class Game:
             print(COL.grey(goals))
 
     def _network_metrics(self, device):
-        rng      = seeded_rng(self.location, self.minutes // 60, device)  # stable this hour
-        ping     = int(rng.triangular(95, 100, 98 ))
-        latency  = int(rng.triangular(9, 37, 20 ))
-        loss     = round(max(0.0, rng.triangular(0.0, 2.2, 0.2)), 2)
-        jitter   = int(rng.uniform(2, 15))
+        key      = (self.location, self.minutes // 60, device)  # stable this hour
+        ping     = int(mix_triangular(95, 100, 98, *key, 'ping'))
+        latency  = int(mix_triangular(9, 37, 20, *key, 'latency'))
+        loss     = round(max(0.0, mix_triangular(0.0, 2.2, 0.2, *key, 'loss')), 2)
+        jitter   = int(mix_uniform(2, 15, *key, 'jitter'))
         if device == 'starlink':
-            power    = int(rng.triangular(24, 48, 36))
-            download = round(rng.triangular(5, 222, 50), 1)
-            upload   = round(rng.triangular(5, 150, 50), 1)
+            power    = int(mix_triangular(24, 48, 36, *key, 'power'))
+            download = round(mix_triangular(5, 222, 50, *key, 'down'), 1)
+            upload   = round(mix_triangular(5, 150, 50, *key, 'up'), 1)
         elif device == 'weboost':
-            power    = int(rng.triangular(24, 48, 36))
-            download = round(rng.triangular(10, 30, 20), 1)
-            upload   = round(rng.triangular(5, 15, 10), 1)
+            power    = int(mix_triangular(24, 48, 36, *key, 'power'))
+            download = round(mix_triangular(10, 30, 20, *key, 'down'), 1)
+            upload   = round(mix_triangular(5, 15, 10, *key, 'up'), 1)
         print(f"Ping Success: {ping}%")
         print(f"Latency: {latency}ms")
         print(f"Power Draw: {power}W")
@@ -707,7 +1016,7 @@ class Game:
         self.in_local = True
         self.local_map_id = m["id"]
         self.local_room_id = m.get("start") or next(iter(m.get("_rooms") or {}), None)
-        print(COL.grey(f"You start exploring {self.world.nodes[self.location]['name']}."))
+        print(COL.grey(f"You start exploring {self.node()['name']}."))
         self.look_local()
     
     def leave_map(self):
@@ -756,7 +1065,7 @@ class Game:
         if not d:
             print("Move which way? n/s/e/w/ne/nw/se/sw"); return
         r = self._cur_room()
-        nxt = r.get('exits', {}).get(d) if r else None
+        nxt = r.get('exits', _EMPTY).get(d) if r else None
         if not nxt:
             print(COL.yellow("You can’t go that way.")); return
         self.local_room_id = nxt
@@ -765,8 +1074,7 @@ class Game:
         self.look_local()
 
     def look_vehicle(self):
-        v = VEHICLES[self.vehicle_type]
-        print(COL.grey(f"{self.vehicle_color.title()} {v['label']} — {self.player_name} ({self.job.replace('_',' ')})"))
+        print(COL.grey(f"{self.vehicle_color.title()} {self.vehicle_label} — {self.player_name} ({self.job.replace('_',' ')})"))
         if self.mode == 'electric':
             print(COL.grey(f"Drive: EV {int(self.ev_battery):.0f}% (~{self.ev_range_mi} mi)"))
         else:
@@ -806,7 +1114,7 @@ class Game:
         if not target:
             print(COL.yellow("They're not here right now.")); return
         print(COL.grey(f"{target['name']} — {target.get('title','')}"))
-        topics = ((target.get('dialogue') or {}).get('topics') or {})
+        topics = ((target.get('dialogue') or _EMPTY).get('topics') or _EMPTY)
         if topics:
             print(f"Topics:", ", ".join(topics.keys()))
         if "shop" in target:
@@ -816,7 +1124,7 @@ class Game:
         key = (item_id or '').strip().lower()
         if not key:
             print(COL.yellow("LOOK ITEM <id>. Use SHOP/TRADE to list ids.")); return
-        it = (getattr(self, 'catalog', {}) or {}).get(key)
+        it = (getattr(self, 'catalog', None) or _EMPTY).get(key)
         if not it:
             print(COL.yellow("Unknown item id.")); return
         name  = it.get('name', key)
@@ -993,9 +1301,9 @@ class Game:
         npc = next((n for n in self.npcs_here_now() if n["id"]==who or n["name"].lower()==who), None)
         if not npc:
             print(COL.yellow("They're not here.")); return
-        greet = npc.get("dialogue", {}).get("greeting", ["They nod."])
+        greet = npc.get("dialogue", _EMPTY).get("greeting", ["They nod."])
         print(random.choice(greet))
-        topics = list((npc.get("dialogue", {}).get("topics") or {}).keys())
+        topics = list((npc.get("dialogue", _EMPTY).get("topics") or _EMPTY).keys())
         if topics:
             print("Topics:", ", ".join(topics))
         if "shop" in npc:
@@ -1008,7 +1316,7 @@ class Game:
         npc = next((n for n in self.npcs_here_now() if n["id"]==who or n["name"].lower()==who), None)
         if not npc:
             print(COL.yellow("They're not here.")); return
-        topics = (npc.get("dialogue", {}).get("topics") or {})
+        topics = (npc.get("dialogue", _EMPTY).get("topics") or _EMPTY)
         lines = topics.get(topic)
         if not lines:
             if topic in ("quest","quests") and npc.get("quests"):
@@ -1088,23 +1396,19 @@ class Game:
             print(COL.grey(f" EV Range: {self.ev_range_mi:.0f} miles"))
 
     def _solar_input_watts_now(self):
-        node = self.node()
-        sol = (node.get('resources', {}) or {}).get('solar', 'fair')
-        site = {'excellent':0.9,'good':0.70,'fair':0.40,'poor':0.20, 'terrible':0.5}.get(sol, 0.5)
+        site = self.node()['_panel_site']
         if self.solar_watts <= 0: return 0.0
-        w = derive_weather(node, self.minutes)
         # Scale by UV (0..uv_peak) normalized to peak
-        uv_norm = clamp(w['uv'] / max(1e-6, float(get_season(self.minutes)[1].get('uv_peak', 8.0))), 0, 1)
+        uv_norm = uv_fraction(self.minutes, 1e-6)
         return self.solar_watts * site * uv_norm
 
     def _wind_input_watts_now(self):
         if self.wind_watts <= 0: return 0.0
-        w = derive_weather(self.node(), self.minutes)
-        frac = {'low':0.1,'medium':0.4,'high':8.0}[w['wind']]
+        frac = WIND_TURBINE_FRAC[_weather_draws(self.node(), self.minutes // DAY_MINUTES + 1)[0]]
         return self.wind_watts * frac
 
     def _generator_input_amps_now(self):
-        s = self.devices.get('generator')
+        s = self.dev_generator
         if not s.get('owned') or not s.get('on'): return 0.0
         if 'diesel' in s.get('fuel') and self.diesel_can_gal <= 0: return 0.0
         if 'gas' in s.get('fuel') and self.gasoline_can_gal <= 0: return 0.0
@@ -1113,25 +1417,36 @@ class Game:
         return charge_a
 
     def _load_amps_now(self):
-        amps = self.base_draw_amps
-        if self.devices['fridge']['owned'] and self.devices['fridge']['on']:
-            amps += self.devices['fridge']['amps']
-        if self.devices['starlink']['owned'] and self.devices['starlink']['on']:
-            amps += self.devices['starlink']['amps']
-        if self.devices['weboost']['owned'] and self.devices['weboost']['on']:
-            amps += self.devices['weboost']['amps']
-        if self.devices['laptop']['owned'] and self.devices['laptop']['on']:
-            amps += self.devices['laptop']['amps']
-        if self.devices['heater']['owned'] and self.devices['heater']['on']:
+        if self._amps_dirty:
+            amps = self.base_draw_amps
+            devs = self.devices
+            for k in LOAD_DEVICES:
+                d = devs[k]
+                if d['owned'] and d['on']: amps += d['amps']
+            heater = self.dev_heater
+            self._amps_cached = (amps, heater['amps'] if heater['owned'] and heater['on'] else None)
+            self._amps_dirty = False
+        # the heater depends on the diesel can too, which drains every tick
+        amps, heater_amps = self._amps_cached
+        if heater_amps is not None:
             if self.diesel_can_gal > 0:
-                amps += self.devices['heater']['amps']
+                amps += heater_amps
             else:
-                self.devices['heater']['on'] = False
+                self.dev_heater['on'] = False; self._amps_dirty = True
         return amps
 
     def node(self):
         return self.world.nodes[self.location]
 
+    def weather(self):
+        """derive_weather for here and now, shared by every action at this instant."""
+        key = (self.location, self.minutes)
+        w = self._weather_cache.get(key)
+        if w is None:
+            if len(self._weather_cache) >= 256: self._weather_cache.clear()
+            w = self._weather_cache[key] = derive_weather(self.node(), self.minutes)
+        return w
+
     # ------------------ XP helpers ------------------
     def add_xp(self, amount, reason=""):
         amount = max(0, int(round(amount)))
@@ -1179,70 +1494,107 @@ class Game:
         on = True if state.lower() in ('on','true','1') else False
         if name == 'heater' and on and self.diesel_can_gal <= 0:
             print(COL.red("No diesel in the can. BUY diesel_can <gallons> first.")); return
-        d['on'] = on
+        d['on'] = on; self._amps_dirty = True
         print(COL.green(f"{name} set to {'ON' if on else 'off'}."))
 
     # ------------------ Time advance ------------------
-    def advance(self, minutes):
-        for _ in range(max(1, minutes // TURN_MINUTES)):
-            net_a, solar_a, wind_a, load_a = self.compute_current()
-            delta_ah  = net_a * (TURN_MINUTES/60.0)
-            cap_ah    = max(1.0, self.house_cap_ah)
+    def advance(self, minutes, trickle=False):
+        """Run the clock forward in TURN_MINUTES ticks. trickle=True adds the
+        passive solar/wind trickle (trickle_step) of work and hiking at the start of each tick."""
+        # Nothing below moves, buys or re-rates anything, so bind it once per call
+        node     = self.node()  # time passes in place
+        heater   = self.dev_heater
+        gd       = self.dev_generator
+        cap_ah   = max(1.0, self.house_cap_ah)
+        gen_cap  = 100.0 * getattr(self, 'house_cap', 1.0)
+        electric = self.mode == 'electric'
+        solar_w, wind_w = self.solar_watts, self.wind_watts
+        site     = node['_solar_site']
+        panel    = node['_panel_site']
+        pet      = self.pet
+        tick_h   = TURN_MINUTES/60.0
+        heater_owned, gen_owned = heater['owned'], gd.get('owned')
+        turns    = max(1, minutes // TURN_MINUTES)
+        pct_per_ah = 100.0 / cap_ah
+        # per-tick factors that only the minute's UV or wind class scales
+        solar_k  = (solar_w/1000.0)*4.0*site
+        wind_k   = wind_w/300.0
+        heater_burn = 0.15 * tick_h
+        gen_burn = gd.get('burn_gph', 0.0) * tick_h
+        gen_diesel = gd.get('fuel','diesel') == 'diesel'
+        gen_pct  = (gd.get('charge_amps',0.0) * tick_h) / gen_cap * 100.0
+        gen_ev   = ((gd.get('charge_amps',0.0) * 12.0)/1000.0) * 4.0 * tick_h
+        # Water, energy and pet energy drain at a flat rate and nothing in the
+        # loop reads them, so they are settled in closed form afterwards.
+        for _ in range(turns):
+            wind = _weather_draws(node, self.minutes // DAY_MINUTES + 1)[0] if wind_w > 0 else None  # this tick's wind class
+            if trickle:
+                # passive solar/wind trickle while working or hiking, ahead of the tick
+                solar_ev = wind_house = wind_ev = 0.0
+                if electric and solar_w > 0 and DAWN_MIN <= self.minutes % DAY_MINUTES < DUSK_MIN:
+                    solar_ev = solar_k*uv_fraction(self.minutes)/4.0
+                if wind_w > 0:
+                    wind_house = wind_k*WIND_HOUSE[wind]/4.0 / pct_per_ah
+                    if electric: wind_ev = wind_k*WIND_EV[wind]/4.0
+                self.battery, ev = trickle_step(self.battery, getattr(self, 'ev_battery', 0.0), solar_ev, wind_house, wind_ev)
+                if electric: self.ev_battery = ev
+            # compute_current(), reduced to the sources this rig actually has
+            solar_a = (solar_w * panel * uv_fraction(self.minutes, 1e-6)) / SYSTEM_VOLTAGE if solar_w > 0 else 0.0
+            wind_a  = (wind_w * WIND_TURBINE_FRAC[wind]) / SYSTEM_VOLTAGE if wind_w > 0 else 0.0
+            net_a   = (solar_a + wind_a) - self._load_amps_now()
+            delta_ah  = net_a * tick_h
             delta_pct = (delta_ah / cap_ah) * 100.0
-            self.battery = clamp(self.battery + delta_pct, 0, 100)
+            b = self.battery + delta_pct
+            self.battery = 100 if b > 100 else 0 if b < 0 else b  # clamp(), inlined in the tick loop
 
             # Diesel heater fuel
-            if self.devices['heater']['owned'] and self.devices['heater']['on']:
-                burn = 0.15 * (TURN_MINUTES/60.0)
-                if self.diesel_can_gal >= burn: self.diesel_can_gal -= burn
-                else: self.diesel_can_gal = 0.0; self.devices['heater']['on'] = False
+            if heater_owned and heater['on']:
+                if self.diesel_can_gal >= heater_burn: self.diesel_can_gal -= heater_burn
+                else: self.diesel_can_gal = 0.0; heater['on'] = False; self._amps_dirty = True
 
             # Passive generator charging per tick (if ON)
-            gd = self.devices.get('generator', {})
-            if gd.get('owned') and gd.get('on'):
+            if gen_owned and gd.get('on'):
                 # fuel burn
-                burn_gal = gd.get('burn_gph', 0.0) * (TURN_MINUTES/60.0)
-                if gd.get('fuel','diesel') == 'diesel':
+                burn_gal = gen_burn
+                if gen_diesel:
                     if self.diesel_can_gal >= burn_gal:
                         self.diesel_can_gal -= burn_gal
                     else:
-                        self.devices['generator']['on'] = False
+                        gd['on'] = False
                         print("Generator stops (out of fuel).")
                         burn_gal = 0.0
                 else:
                     if self.gasoline_can_gal >= burn_gal:
                         self.gasoline_can_gal -= burn_gal
                     else:
-                        self.devices['generator']['on'] = False
+                        gd['on'] = False
                         print("Generator stops (out of fuel).")
                         burn_gal = 0.0
             
                 if burn_gal > 0.0:
                     # add house %
-                    cap_ah  = 100.0 * getattr(self, 'house_cap', 1.0)
-                    add_pct = (gd.get('charge_amps',0.0) * (TURN_MINUTES/60.0)) / cap_ah * 100.0
-                    self.battery = clamp(self.battery + add_pct, 0, 100)
+                    b = self.battery + gen_pct
+                    self.battery = 100 if b > 100 else 0 if b < 0 else b
                     # trickle EV too if electric mode
-                    if self.mode == 'electric':
-                        watts = gd.get('charge_amps',0.0) * 12.0
-                        ev_add = (watts/1000.0) * 4.0 * (TURN_MINUTES/60.0)
-                        self.ev_battery = clamp(self.ev_battery + ev_add, 0, 100)
+                    if electric:
+                        ev = self.ev_battery + gen_ev
+                        self.ev_battery = 100 if ev > 100 else 0 if ev < 0 else ev
 
             self.minutes += TURN_MINUTES
-            self.water  = clamp(self.water - 0.03, 0, self.water_cap_gallons)
-            self.energy = clamp(self.energy - 0.8, 0, 100)
-            if self.pet: self.pet.tick(TURN_MINUTES)
 
-            if self.mode == 'electric':
-                if is_daylight(self.minutes) and self.solar_watts > 0:
-                    node = self.node()
-                    site = {'excellent':1.0,'good':0.75,'fair':0.5,'poor':0.25}.get((node.get('resources',{}) or {}).get('solar','fair'),0.5)
-                    uv_norm = clamp(derive_weather(node, self.minutes)['uv'] / max(1.0, get_season(self.minutes)[1].get('uv_peak', 8.0)), 0, 1)
-                    self.ev_battery = clamp(self.ev_battery + (self.solar_watts/1000.0)*4.0*site*uv_norm/4.0, 0, 100)
-                if self.wind_watts > 0:
-                    w = derive_weather(self.node(), self.minutes)
-                    ev_level = {'low':0.2,'medium':0.6,'high':1.0}[w['wind']]
-                    self.ev_battery = clamp(self.ev_battery + (self.wind_watts/300.0)*ev_level/4.0, 0, 100)
+            if electric:
+                if solar_w > 0 and DAWN_MIN <= self.minutes % DAY_MINUTES < DUSK_MIN:  # is_daylight()
+                    ev = self.ev_battery + solar_k*uv_fraction(self.minutes)/4.0
+                    self.ev_battery = 100 if ev > 100 else 0 if ev < 0 else ev
+                if wind_w > 0:
+                    ev = self.ev_battery + wind_k*WIND_EV[_weather_draws(node, self.minutes // DAY_MINUTES + 1)[0]]/4.0
+                    self.ev_battery = 100 if ev > 100 else 0 if ev < 0 else ev
+
+        # 0.03 G and 0.8 energy per turn; rounding sheds float dust so a stat that
+        # should read 20 doesn't truncate to 19 after many small steps
+        self.water  = round(clamp(self.water - turns*3/100, 0, self.water_cap_gallons), 6)
+        self.energy = round(clamp(self.energy - turns*8/10, 0, 100), 6)
+        if pet: pet.tick(TURN_MINUTES*turns)
 
     # ------------------ Actions ------------------
     def print_hud(self):
@@ -1254,7 +1606,7 @@ class Game:
 
     def look(self):
         n = self.node()
-        w = derive_weather(n, self.minutes)
+        w = self.weather()
         biome = n.get('biome','').replace('_',' ')
         elev = n.get('elevation_ft','?')
         print()
@@ -1263,8 +1615,9 @@ class Game:
         desc = n.get('description')
         sixel = n.get('sixel')
         if desc: print(COL.green(desc))
-        input(COL.blue("Press ENTER to continue..."))
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self.interactive:
+            input(COL.blue("Press ENTER to continue..."))
+            os.system('cls' if os.name == 'nt' else 'clear')
         if sixel: 
             show_image(sixel)
         #print(f"Time: {minutes_to_hhmm(self.minutes)}")
@@ -1283,7 +1636,7 @@ class Game:
             print(COL.green(f"\nYour {comp} {self.pet.name} {action}. Bond {int(self.pet.bond)}%. Energy {int(self.pet.energy)}%."))
 
     def status(self):
-        print(COL.grey(f"{self.player_name} — {self.vehicle_color.title()} {VEHICLES[self.vehicle_type]['label']} | Job: {JOBS[self.job]['label']}"))
+        print(COL.grey(f"{self.player_name} — {self.vehicle_color.title()} {self.vehicle_label} | Job: {self.job_label}"))
         print(COL.grey(f"Location: {self.node()['name']} | {minutes_to_hhmm(self.minutes)}"))
         self.print_hud()
 
@@ -1313,29 +1666,29 @@ class Game:
         frm, to, conn = self.route[self.route_idx]
         turns, w = edge_drive_turns(self.world, frm, conn, self.minutes)
         hours = turns * TURN_MINUTES / 60.0
-        miles = float(conn.get('miles', 10))
+        miles = self.world.adj_miles[conn['_edge']]
 
         # Weather closures/delays on rough roads
         road = conn.get('road', 'mixed')
         closure_p = 0.0
-        if w['flood_watch'] and road in ('trail','gravel','scenic'):
+        if w.flood_watch and road in ('trail','gravel','scenic'):
             closure_p = 0.12
-        elif w['monsoon'] and road in ('trail','gravel'):
+        elif w.monsoon and road in ('trail','gravel'):
             closure_p = 0.08
         
         # Slight advantage for burlier rigs
         if self.vehicle_type in ('truck_camper','skoolie'):
             closure_p *= 0.6  # bigger stance, better clearance
         
-        rng2 = seeded_rng(frm, to, int(self.minutes/60), 'closure')
-        if rng2.random() < closure_p:
+        hour = self.minutes // 60
+        if mix_float(frm, to, hour, 'closure') < closure_p:
             # Either a full closure (must wait), or a messy delay
-            if rng2.random() < 0.4:
-                wait_h = rng2.uniform(0.5, 2.0)
+            if mix_float(frm, to, hour, 'closure', 'kind') < 0.4:
+                wait_h = mix_uniform(0.5, 2.0, frm, to, hour, 'closure', 'wait')
                 self.advance(int(wait_h*60))
                 print(f"Road closure lifts after ~{wait_h:.1f}h wait due to high water.")
             else:
-                extra = rng2.randint(2, 5)  # extra turns
+                extra = mix_int(2, 5, frm, to, hour, 'closure', 'extra')  # extra turns
                 turns += extra
                 print(f"Muddy detours slow you down (+{extra} turns).")
 
@@ -1360,9 +1713,9 @@ class Game:
             self.pet.energy = clamp(self.pet.energy - 4.0*hours, 0, 100)
             self.pet.alert  = clamp(self.pet.alert + 5.0, 0, 100)
         # Detour chance
-        rng = seeded_rng(frm, to, int(self.minutes/60))
-        if rng.random() < 0.06:
-            delay = rng.randint(1,3)
+        hour = self.minutes // 60  # after any closure wait
+        if mix_float(frm, to, hour, 'detour') < 0.06:
+            delay = mix_int(1, 3, frm, to, hour, 'detour', 'turns')
             print(COL.yellow(f"A detour slows you down (+{delay} turns).")); turns += delay; hours = turns * TURN_MINUTES / 60.0
         self.advance(turns*TURN_MINUTES)
         self.location = to
@@ -1371,19 +1724,20 @@ class Game:
         if self.route_idx >= len(self.route): print(COL.grey("Route complete."))
         # XP: reward per mile & road difficulty
         road = conn.get('road','mixed'); grade = conn.get('grade','mixed')
-        xp = miles * {'interstate':0.25,'highway':0.3,'scenic':0.4,'mixed':0.35,'gravel':0.6,'trail':1.0}.get(road,0.3)
-        xp *= {'flat':1.0,'light':1.05,'moderate':1.15,'mixed':1.1,'steep':1.3}.get(grade,1.0)
+        xp = miles * ROAD_XP.get(road,0.3)
+        xp *= GRADE_XP.get(grade,1.0)
         self.add_xp(int(xp), "driving")
 
     def check_weather(self):
-        w = derive_weather(self.node(), self.minutes)
+        w = self.weather()
         daylight = "daylight" if is_daylight(self.minutes) else "night"
         print(COL.grey(f"{self.node()['name']} ({daylight}): {describe_weather(w)}."))
 
     def camp(self, style):
         style = (style or '').lower()
-        if style not in ('stealth','paid','dispersed'):
+        if style not in CAMP_STYLES:
             print(COL.yellow("CAMP how? Options: stealth | paid | dispersed")); return
+        node = self.node()
         # Sleep until next 06:00 (not 24h+)
         now = self.minutes % DAY_MINUTES
         if now <= 6*60: sleep_minutes = 6*60 - now
@@ -1391,8 +1745,8 @@ class Game:
         hours = sleep_minutes / 60.0
 
         # Weather for wind bonus
-        w = derive_weather(self.node(), self.minutes)
-        wind_level = {'low':0.0,'medium':0.8,'high':1.5}[w['wind']]
+        w = self.weather()
+        wind_level = WIND_HOUSE[w.wind]
         wind_scale = (self.wind_watts / 300.0) if self.wind_watts > 0 else 0.2
         wind_bonus = wind_level * wind_scale  # % per hour to HOUSE battery (applied by advance anyway)
 
@@ -1403,29 +1757,28 @@ class Game:
         elif style == 'stealth':
             energy_gain, morale_gain, pet_energy, pet_bond = 30, 8, 14, 2
             ranger_knock = 0.08; note = "Stealth spot: close to town, but keep it low-key."
-            if self.node().get('pet_rules') == 'strict': ranger_knock += 0.06
+            if node.get('pet_rules') == 'strict': ranger_knock += 0.06
             if self.pet and self.pet.alert > 60:         ranger_knock += 0.04
         else:  # dispersed
             energy_gain, morale_gain, pet_energy, pet_bond = 45, 20, 20, 3
             if self.has_tent: energy_gain += 5; morale_gain += 5; pet_energy += 5; note = "Dispersed with tent: free, solitary, and cozy under the stars."
             else: note = "Dispersed site: free, solitary, sky for days."
-            in_park = self.location in {'zion','bryce','arches','canyonlands','capitol_reef'}
+            in_park = node['_in_park']
             ranger_knock = 0.04 if in_park else 0.005
 
         # --- Night visitors (rodents) ---
-        trap_owned = self.devices['mousetrap']['owned']
+        trap_owned = self.dev_mousetrap['owned']
         if not trap_owned:
             # Baseline risk
             risk = 0.10
         
             # Drawn to warmth/food; colder nights push them in
-            w = derive_weather(self.node(), self.minutes)
-            if w['heat'] == 'cold':     risk += 0.06
+            w = self.weather()
+            if w.heat == 'cold':     risk += 0.06
             if self.food > 0:           risk += 0.05
         
             # Some biomes (town edges, farms, campgrounds) see more scroungers
-            biome = (self.node().get('biome') or '').lower()
-            if any(k in biome for k in ('mesa_desert','high_desert','alpine','town_desert')):  # tweak list as you like
+            if node['_scroungers']:
                 risk += 0.03
         
             # Deterrence: pet → big reduction; cat → bigger reduction
@@ -1434,16 +1787,16 @@ class Game:
                 risk *= pet_mult
         
             # Roll
-            rng = seeded_rng(self.location, self.minutes // DAY_MINUTES, 'rodent')
-            if rng.random() < risk:
+            day = self.minutes // DAY_MINUTES
+            if mix_float(self.location, day, 'rodent') < risk:
                 # Pick a light consequence
-                if rng.random() < 0.6 and self.food > 0:
-                    lost = 1 if self.food == 1 else rng.randint(1, min(2, self.food))
+                if mix_float(self.location, day, 'rodent', 'kind') < 0.6 and self.food > 0:
+                    lost = 1 if self.food == 1 else mix_int(1, min(2, self.food), self.location, day, 'rodent', 'food')
                     self.food = max(0, self.food - lost)
                     self.morale = clamp(self.morale - 3, 0, 100)
                     print(COL.red(f"Night visitors chew into your rations (−{lost} food). You’re not thrilled."))
                 else:
-                    drop = rng.uniform(1.5, 4.0)  # tiny wiring nibble → minor house loss
+                    drop = mix_uniform(1.5, 4.0, self.location, day, 'rodent', 'wiring')  # tiny wiring nibble → minor house loss
                     self.battery = clamp(self.battery - drop, 0, 100)
                     self.energy = clamp(self.energy - 4, 0, 100)  # sleep disturbed
                     print(COL.red("A mouse gnaws some insulation. You lose a bit of battery and sleep."))
@@ -1457,27 +1810,24 @@ class Game:
             self.pet.bond   = clamp(self.pet.bond   + pet_bond, 0, 100)
 
         # Food spoilage if no working fridge and it’s hot
-        fridge_ok = (self.devices['fridge']['owned'] and self.devices['fridge'].get('on'))
-        w = derive_weather(self.node(), self.minutes)
-        if not fridge_ok and w['heat'] in ('hot','very_hot') and self.food > 0:
-            rng = seeded_rng(self.location, self.minutes // DAY_MINUTES, 'spoil')
-            if rng.random() < 0.35:  # ~1/3 of hot nights
-                spoiled = 1 if self.food == 1 else rng.randint(1, min(2, self.food))
+        fridge_ok = (self.dev_fridge['owned'] and self.dev_fridge.get('on'))
+        w = self.weather()
+        if not fridge_ok and w.heat in ('hot','very_hot') and self.food > 0:
+            day = self.minutes // DAY_MINUTES
+            if mix_float(self.location, day, 'spoil') < 0.35:  # ~1/3 of hot nights
+                spoiled = 1 if self.food == 1 else mix_int(1, min(2, self.food), self.location, day, 'spoil', 'rations')
                 self.food = max(0, self.food - spoiled)
                 print(COL.yellow(f"The heat spoils {spoiled} ration{'s' if spoiled>1 else ''}."))
 
         # Events
         if style == 'dispersed':
-            biome = (self.node().get('biome') or '').lower()
-            maybe_remote = any(k in biome for k in ['desert','swell','salt','mesa','canyon'])
-            rng_sig = seeded_rng(self.location, int(self.minutes/60), 'signal')
-            has_signal = not (maybe_remote and rng_sig.random() < 0.6)
+            maybe_remote = node['_remote']
+            has_signal = not (maybe_remote and mix_float(self.location, self.minutes // 60, 'signal') < 0.6)
             if not has_signal: print(COL.yellow("No bars out here. Your phone becomes a very expensive paperweight tonight."))
-            inc = self.job_perks.get('remote_camp_income', 0)
+            inc = self.perks.remote_camp_income
             if inc and has_signal:
                 self.cash += inc; print(COL.green(f"You push a little code under the stars (+${inc})."))
-        rng = seeded_rng(self.location, int(self.minutes/60), style)
-        if rng.random() < ranger_knock:
+        if mix_float(self.location, self.minutes // 60, style) < ranger_knock:
             print(COL.yellow("A flashlight sweeps your curtains. A ranger checks on you."))
             if style == 'paid': print(COL.green("Your permit checks out. You roll over and go back to sleep."))
             elif style == 'dispersed': print(COL.yellow("Friendly reminder about tread-lightly and stay limits. You chat stars and keep it mellow."))
@@ -1486,14 +1836,14 @@ class Game:
         self.advance(sleep_minutes)
         print(COL.grey(f"{note} You camp {style} for {hours:.1f}h. Morning at {minutes_to_hhmm(self.minutes)}. Battery {int(self.battery)}%."))
         # XP
-        self.add_xp({'paid':10,'stealth':15,'dispersed':18}[style], f"camp ({style})")
+        self.add_xp(CAMP_XP[style], f"camp ({style})")
 
     def cook(self):
         if self.food <= 0: print(COL.red("You rummage for crumbs. No food to cook.")); return
         used = "cold"
-        if self.devices['stove']['owned'] and self.propane_lb >= 0.2:
+        if self.dev_stove['owned'] and self.propane_lb >= 0.2:
             self.propane_lb -= 0.2; used = "stove"
-        elif self.devices['jetboil']['owned'] and self.butane_can >= 0.25:
+        elif self.dev_jetboil['owned'] and self.butane_can >= 0.25:
             self.butane_can -= 0.25; used = "jetboil"
         else:
             used = "pan + inverter"
@@ -1526,27 +1876,13 @@ class Game:
         hours = min(hours, max(1.0, minutes_left/60.0))
         ticks = int((hours * 60) // TURN_MINUTES) or 1
         print(COL.grey(f"You set out on a ~{hours:.1f}h hike."))
-        found = False
-        windows, _w0 = current_time_windows(self.minutes, node)
-        for _ in range(ticks):
-            if self.mode == 'electric' and self.solar_watts > 0 and is_daylight(self.minutes):
-                sol_quality = (node.get('resources', {}) or {}).get('solar', 'fair')
-                site = {'excellent':1.0,'good':0.75,'fair':0.5,'poor':0.25}.get(sol_quality, 0.5)
-                uv_norm = clamp(derive_weather(node, self.minutes)['uv'] / max(1.0, get_season(self.minutes)[1].get('uv_peak', 8.0)), 0, 1)
-                self.ev_battery = clamp(self.ev_battery + (self.solar_watts / 1000.0) * 4.0 * site * uv_norm / 4.0, 0, 100)
-            if self.wind_watts > 0:
-                w = derive_weather(node, self.minutes)
-                house_level = {'low':0.0, 'medium':0.8, 'high':1.5}[w['wind']]
-                ev_level    = {'low':0.2, 'medium':0.6, 'high':1.0}[w['wind']]
-                self.battery   = clamp(self.battery   + (self.wind_watts / 300.0) * house_level / 4.0 / self._pct_per_ah(), 0, 100)
-                if self.mode=='electric':
-                    self.ev_battery = clamp(self.ev_battery + (self.wind_watts / 300.0) * ev_level / 4.0, 0, 100)
-            self.advance(TURN_MINUTES)
-            if not found and random.random() < 0.08:
-                found = True; self.morale = clamp(self.morale + 4, 0, 100); print(COL.green("You crest a ridge to a ridiculous view. Morale soars."))
+        self.advance(ticks*TURN_MINUTES, trickle=True)
+        # an 8% chance per tick, at most once: one draw against 1 - 0.92**ticks
+        if random.random() < 1.0 - 0.92 ** ticks:
+            self.morale = clamp(self.morale + 4, 0, 100); print(COL.green("You crest a ridge to a ridiculous view. Morale soars."))
         extra_energy = min(12, int(hours * 3))
         extra_water  = round(0.12 * hours, 2)
-        mult = self.job_perks.get('hike_energy_mult', 1.0)
+        mult = self.perks.hike_energy_mult
         self.energy = clamp(self.energy - int(extra_energy * mult), 0, 100)
         self.water  = clamp(self.water  - extra_water, 0, self.water_cap_gallons)
         if self.pet:
@@ -1556,8 +1892,8 @@ class Game:
               f"{'EV ' + str(int(self.ev_battery)) + '%' if self.mode=='electric' else 'Fuel ' + f'{self.fuel_gal:.1f} gal'} | "
               f"Water {self.water:.1f}G | Energy {int(self.energy)}."))
         # XP: hikes worth a solid chunk
-        w_now = derive_weather(node, self.minutes)
-        diff = 1.0 + (0.15 if w_now['wind']=='high' else 0) + (0.10 if w_now['heat']=='hot' else 0)
+        w_now = self.weather()
+        diff = 1.0 + (0.15 if w_now.wind=='high' else 0) + (0.10 if w_now.heat=='hot' else 0)
         if self.job == 'trail_guide': diff *= 1.10
         self.add_xp(int(hours*10*diff), "hiking")
 
@@ -1566,7 +1902,7 @@ class Game:
         kind = (kind or '').lower().strip()
         if not kind or kind == 'job':
             jk = self.job
-            kind = {'photographer':'photo','remote_dev':'dev','mechanic':'mechanic','trail_guide':'guide','artist':'artist'}.get(jk, 'photo')
+            kind = JOB_WORK_KIND.get(jk, 'photo')
         if hours is None:
             hours = random.randint(1,4)
         try: hours = float(hours)
@@ -1575,15 +1911,17 @@ class Game:
         ticks = int((hours*60) // TURN_MINUTES) or 1
 
         today = self.minutes // DAY_MINUTES
-        if self.work_hours_day != today: self.work_hours_day = today; self.work_hours_today = {}
+        worked = self.work_hours_today
+        if self.work_hours_day != today: self.work_hours_day = today; worked.clear()
 
-        windows, cur_weather = current_time_windows(self.minutes, node)
-        biome = (node.get('biome') or '').lower()
+        windows = time_windows(self.minutes, node)
+        cur_weather = self.weather()  # as the shift starts; feeds the XP difficulty
+        tags = node['_biome_tags']
         photogenic = 1.0
-        if any(k in biome for k in ['arches','canyon']): photogenic = 1.35
-        if 'desert' in biome: photogenic = max(photogenic, 1.25)
-        if 'salt' in biome: photogenic = max(photogenic, 1.30)
-        if 'alpine' in biome: photogenic = max(photogenic, 1.15)
+        if 'arches' in tags or 'canyon' in tags: photogenic = 1.35
+        if 'desert' in tags: photogenic = max(photogenic, 1.25)
+        if 'salt' in tags: photogenic = max(photogenic, 1.30)
+        if 'alpine' in tags: photogenic = max(photogenic, 1.15)
         in_moab = (self.location == 'moab')
 
         base = 18.0; tip_mult = 1.0
@@ -1597,17 +1935,14 @@ class Game:
             # signal heuristic (use starlink as override)
             has_signal = any(t in windows for t in ('daylight','night'))  # time doesn't matter; use node+daily roll
             # crude per-node signal: reuse helper below (simple)
-            if not self.devices['starlink']['owned']:
-                # 50/50 coarse chance outside towns
-                biome_signal = 0.95 if 'town' in biome else 0.55
-                rng = seeded_rng(self.location, today, 'signal')
-                has_signal = rng.random() < biome_signal
+            if not self.dev_starlink['owned']:
+                has_signal = signal_today(node, today)
             if not has_signal: fail_prereq = "No usable signal here; try Moab or move for coverage."
             base = 28.0 * (1.2 if in_moab else 1.0)
         elif kind == 'mechanic':
             base = 30.0 if in_moab else 22.0
         elif kind == 'guide':
-            near_park = self.location in {'zion','bryce','arches','canyonlands','capitol_reef'}
+            near_park = node['_in_park']
             base = 24.0 if near_park or in_moab else 18.0
             tip_mult *= max(window_multiplier("morning", windows), window_multiplier("golden_hour", windows))
         elif kind == 'artist':
@@ -1615,67 +1950,52 @@ class Game:
             tip_mult *= max(1.0, window_multiplier("golden_hour", windows))
         elif kind == 'gig':
             # treat as generic short work with random pay
-            rng = seeded_rng(self.location, today, 'gig')
-            hours = rng.uniform(1.5, 3.0); ticks = int((hours*60)//TURN_MINUTES) or 1
-            base = rng.uniform(18, 32); tip_mult *= rng.uniform(0.9, 1.2)
+            hours = mix_uniform(1.5, 3.0, self.location, today, 'gig', 'hours'); ticks = int((hours*60)//TURN_MINUTES) or 1
+            base = mix_uniform(18, 32, self.location, today, 'gig', 'pay'); tip_mult *= mix_uniform(0.9, 1.2, self.location, today, 'gig', 'tips')
         else:
             print(COL.yellow("Unknown work type. Try: WORK photo|dev|mechanic|guide|artist|gig [hours]")); return
 
         if fail_prereq: print(fail_prereq); return
 
         # Fatigue
-        prev = self.work_hours_today.get(kind, 0.0)
+        prev = worked.get(kind, 0.0)
         fatigue_mult = 1.0 if prev < 4 else 0.85 if prev < 6 else 0.7 if prev < 8 else 0.55
 
         # Job perks
         perk_mult = 1.0
-        if kind == 'photo':   perk_mult *= (1.0 + self.job_perks.get('epic_bonus', 0.0) * 0.5)
-        if kind == 'artist':  perk_mult *= (1.0 + self.job_perks.get('epic_bonus', 0.0) * 0.25)
+        if kind == 'photo':   perk_mult *= (1.0 + self.perks.epic_bonus * 0.5)
+        if kind == 'artist':  perk_mult *= (1.0 + self.perks.epic_bonus * 0.25)
         if kind == 'dev' and self.job == 'remote_dev': perk_mult *= 1.10
         if kind == 'mechanic' and self.job == 'mechanic': perk_mult *= 1.10
         if kind == 'guide' and self.job == 'trail_guide': perk_mult *= 1.10
 
-        rng = seeded_rng(self.location, today, kind)
-        variance = rng.uniform(0.9, 1.15)
+        variance = mix_uniform(0.9, 1.15, self.location, today, kind, 'variance')
         hourly = base * tip_mult * perk_mult * fatigue_mult * variance
         gross = hourly * hours
 
         if kind in ('photo','artist'):
-            if rng.random() < (0.15 + 0.05 * (1 if 'golden_hour' in windows else 0)):
-                bonus = rng.randint(40, 140); bonus = int(bonus * (1.0 + self.job_perks.get('epic_bonus', 0.0))); gross += bonus
+            if mix_float(self.location, today, kind, 'print') < (0.15 + 0.05 * (1 if 'golden_hour' in windows else 0)):
+                bonus = mix_int(40, 140, self.location, today, kind, 'bonus'); bonus = int(bonus * (1.0 + self.perks.epic_bonus)); gross += bonus
                 print(COL.green(f"A client buys a photo print (+${bonus})."))
 
-        for _ in range(ticks):
-            if self.mode == 'electric' and self.solar_watts > 0 and is_daylight(self.minutes):
-                sol = (node.get('resources', {}) or {}).get('solar', 'fair')
-                site = {'excellent':1.0,'good':0.75,'fair':0.5,'poor':0.25}.get(sol,0.5)
-                uv_norm = clamp(derive_weather(node, self.minutes)['uv'] / max(1.0, get_season(self.minutes)[1].get('uv_peak', 8.0)), 0, 1)
-                self.ev_battery = clamp(self.ev_battery + (self.solar_watts/1000.0)*4.0*site*uv_norm/4.0, 0, 100)
-            if self.wind_watts > 0:
-                w = derive_weather(node, self.minutes)
-                house_level = {'low':0.0,'medium':0.8,'high':1.5}[w['wind']]
-                ev_level    = {'low':0.2,'medium':0.6,'high':1.0}[w['wind']]
-                self.battery    = clamp(self.battery + (self.wind_watts/300.0)*house_level/4.0 / self._pct_per_ah(), 0, 100)
-                if self.mode=='electric':
-                    self.ev_battery = clamp(self.ev_battery + (self.wind_watts/300.0)*ev_level/4.0, 0, 100)
-            self.advance(TURN_MINUTES)
+        self.advance(ticks*TURN_MINUTES, trickle=True)
 
         extra_energy = int((2.5 if kind!='dev' else 1.5) * hours)
         extra_water  = round(0.06 * hours, 2)
         self.energy = clamp(self.energy - extra_energy, 0, 100)
         self.water  = clamp(self.water - extra_water, 0, self.water_cap_gallons)
-        gross = int(round(gross)); self.cash += gross; self.work_hours_today[kind] = self.work_hours_today.get(kind, 0.0) + hours
+        gross = int(round(gross)); self.cash += gross; worked[kind] = prev + hours
         print(COL.grey(f"You work {kind} for ~{hours:.1f}h at ~${hourly:.0f}/h. Paid ${gross}."))
         print(COL.green(f"Now: Cash ${self.cash:,.2f} | House {int(self.battery)}% | "
               f"{('EV '+str(int(self.ev_battery))+'%') if self.mode=='electric' else ('Fuel '+f'{self.fuel_gal:.1f} gal')} | "
               f"Water {self.water:.1f}G | Energy {int(self.energy)}."))
         # XP: based on hours and difficulty (wind/heat add challenge)
-        diff = 1.0 + (0.1 if cur_weather['wind']=='high' else 0) + (0.1 if cur_weather['heat']=='hot' else 0)
+        diff = 1.0 + (0.1 if cur_weather.wind=='high' else 0) + (0.1 if cur_weather.heat=='hot' else 0)
         self.add_xp(int(hours*12*diff), f"work:{kind}")
 
     # ---------- Moab Shop ----------
     def shop(self):
-        if self.location not in ('moab','green_river','bryce'): print(COL.yellow("No outfitter here.")); return
+        if self.location not in SHOP_TOWNS: print(COL.yellow("No outfitter here.")); return
         loc = self.location.replace('_',' ').title()
         print(loc)
         print(COL.blue(f"{loc} Outfitters — items (BUY <item_id> [qty])"))
@@ -1687,58 +2007,80 @@ class Game:
             print(COL.grey(f"  {key:<12} ${price:<5} — {name:<18} (requires level {lvl})."))
         print(f"Cash: {COL.green(f'${self.cash:,.2f}')}")
 
+    # Catalog effect handlers: (self, qty, dev) -> what was purchased, "already", or None.
+    # dev is the part after ':' for keyed effects such as "device:fridge".
+    def _eff_food_rations(self, qty, dev):
+        before = self.food; self.food = min(self.food + qty, self.food_cap_rations); return self.food - before
+
+    def _eff_water_gallons(self, qty, dev):
+        before = self.water; self.water = clamp(self.water + 1.0*qty, 0, self.water_cap_gallons); return round(self.water - before, 1)
+
+    def _eff_solar_watts(self, qty, dev):
+        before = self.solar_watts
+        self.solar_watts = min(self.solar_watts + qty, self.solar_cap_watts)
+        return self.solar_watts - before
+
+    def _eff_wind_watts(self, qty, dev):
+        before = self.wind_watts
+        self.wind_watts = min(self.wind_watts + qty, self.wind_cap_watts)
+        return self.wind_watts - before
+
+    def _eff_ev_range_mi(self, qty, dev):
+        before = self.ev_range_mi; self.ev_range_mi = min(self.ev_range_mi + 40*qty, 400); return self.ev_range_mi - before
+
+    def _eff_water_cap_gallons(self, qty, dev):
+        before = self.water_cap_gallons; self.water_cap_gallons = min(self.water_cap_gallons + 10*qty, self.max_water_cap); return self.water_cap_gallons - before
+
+    def _eff_food_cap_rations(self, qty, dev):
+        before = self.food_cap_rations; self.food_cap_rations = min(self.food_cap_rations + 5*qty, self.max_food_cap); return self.food_cap_rations - before
+
+    def _eff_house_cap_ah(self, qty, dev):
+        before = self.house_cap_ah
+        self.house_cap_ah = clamp(self.house_cap_ah + float(qty), 50.0, 800.0)
+        return f"+{int(self.house_cap_ah - before)} Ah"
+
+    def _eff_has_tent(self, qty, dev):
+        if self.has_tent: return "already"
+        self.has_tent = True; return "installed"
+
+    def _eff_device(self, qty, dev):
+        if self.devices.get(dev,{}).get('owned', False): return "already"
+        if dev not in self.devices: self.devices[dev] = {'owned': False}
+        self.devices[dev]['owned'] = True; self._amps_dirty = True; return "installed"
+
+    def _eff_device_amps(self, qty, dev):
+        return None  # amps come from the effect's value string; set in buy() before effects apply
+
+    def _eff_diesel_can_gal(self, qty, dev):
+        self.diesel_can_gal = max(0.0, self.diesel_can_gal + qty); return f"{qty} gal"
+
+    def _eff_gasoline_can_gal(self, qty, dev):
+        self.gasoline_can_gal = max(0.0, self.gasoline_can_gal + qty); return f"{qty} gal"
+
+    def _eff_propane_lb(self, qty, dev):
+        self.propane_lb = max(0.0, self.propane_lb + qty); return f"{qty} lb"
+
+    def _eff_butane_can(self, qty, dev):
+        self.butane_can = max(0.0, self.butane_can + qty); return f"{qty} can"
+
+    EFFECTS = {
+        'food_rations': _eff_food_rations, 'water_gallons': _eff_water_gallons,
+        'solar_watts': _eff_solar_watts, 'wind_watts': _eff_wind_watts, 'ev_range_mi': _eff_ev_range_mi,
+        'water_cap_gallons': _eff_water_cap_gallons, 'food_cap_rations': _eff_food_cap_rations,
+        'house_cap_ah': _eff_house_cap_ah, 'has_tent': _eff_has_tent,
+        'device': _eff_device, 'device_amps': _eff_device_amps,
+        'diesel_can_gal': _eff_diesel_can_gal, 'gasoline_can_gal': _eff_gasoline_can_gal,
+        'propane_lb': _eff_propane_lb, 'butane_can': _eff_butane_can,
+    }
+
     def _apply_effect(self, key, qty):
         """Resolve one catalog effect key for quantity qty."""
-        purchased = None
-        if key == "food_rations":
-            before = self.food; self.food = min(self.food + qty, self.food_cap_rations); purchased = self.food - before
-        elif key == "water_gallons":
-            before = self.water; self.water = clamp(self.water + 1.0*qty, 0, self.water_cap_gallons); purchased = round(self.water - before, 1)
-        elif key == "solar_watts":
-            before = self.solar_watts
-            self.solar_watts = min(self.solar_watts + qty, self.solar_cap_watts)
-            purchased = self.solar_watts - before
-        elif key == "wind_watts":
-            before = self.wind_watts
-            self.wind_watts = min(self.wind_watts + qty, self.wind_cap_watts)
-            purchased = self.wind_watts - before
-        elif key == "ev_range_mi":
-            before = self.ev_range_mi; self.ev_range_mi = min(self.ev_range_mi + 40*qty, 400); purchased = self.ev_range_mi - before
-        elif key == "water_cap_gallons":
-            before = self.water_cap_gallons; self.water_cap_gallons = min(self.water_cap_gallons + 10*qty, self.max_water_cap); purchased = self.water_cap_gallons - before
-        elif key == "food_cap_rations":
-            before = self.food_cap_rations; self.food_cap_rations = min(self.food_cap_rations + 5*qty, self.max_food_cap); purchased = self.food_cap_rations - before
-        elif key == "house_cap_ah":
-            before = self.house_cap_ah
-            self.house_cap_ah = clamp(self.house_cap_ah + float(qty), 50.0, 800.0)
-            purchased = f"+{int(self.house_cap_ah - before)} Ah"
-        elif key == "has_tent":
-            if self.has_tent: return "already"
-            self.has_tent = True; purchased = "installed"
-        elif key.startswith("device:"):
-            dev = key.split(":",1)[1]
-            if self.devices.get(dev,{}).get('owned', False): return "already"
-            if dev not in self.devices: self.devices[dev] = {'owned': False}
-            self.devices[dev]['owned'] = True; purchased = "installed"
-        elif key.startswith("device_amps:"):
-            dev = key.split(":",1)[1]
-            try:
-                amps = float(str(qty))  # overload qty for amps? we'll set from effect value separately
-            except Exception:
-                amps = None
-            # ignore here; amps set via value string of effect; handled in buy()
-        elif key == "diesel_can_gal":
-            self.diesel_can_gal = max(0.0, self.diesel_can_gal + qty); purchased = f"{qty} gal"
-        elif key == "gasoline_can_gal":
-            self.gasoline_can_gal = max(0.0, self.gasoline_can_gal + qty); purchased = f"{qty} gal"
-        elif key == "propane_lb":
-            self.propane_lb = max(0.0, self.propane_lb + qty); purchased = f"{qty} lb"
-        elif key == "butane_can":
-            self.butane_can = max(0.0, self.butane_can + qty); purchased = f"{qty} can"
-        return purchased
+        name, sep, dev = key.partition(':')
+        handler = self.EFFECTS.get(name if sep else key)
+        return handler(self, qty, dev) if handler else None
 
     def buy(self, item_id, qty=1):
-        if self.location not in ('moab','bryce','green_river'):
+        if self.location not in SHOP_TOWNS:
             print(COL.yellow("There are no shops here.")); return
     
         item_id = (item_id or '').lower()
@@ -1764,26 +2106,19 @@ class Game:
         if unmet: return
     
         # ---- 2) PRE-CHECK hard caps / already-owned BEFORE charging ----
-        if "solar_watts" in effects and self.solar_watts >= self.solar_cap_watts:
-            print(COL.yellow("You're already at max solar wattage")); return
-        if "wind_watts" in effects and self.wind_watts >= self.wind_cap_watts:
-            print(COL.yellow("You're already at max wind wattage")); return
-        if "has_tent" in effects and self.has_tent:
-            print(COL.yellow("You already own a tent.")); return
-        if "gasoline_can_gal" in effects and self.gasoline_can_gal > self.gasoline_can_cap:
-            print(COL.yellow("You're already at max extra gasoline.")); return
-        if "gasoline_can_gal" in effects and self.diesel_can_gal > self.diesel_can_cap:
-            print(COL.yellow("You're already at max extra diesel.")); return
+        for eff_key, full, msg in BUY_CAPS:
+            if eff_key in effects and full(self):
+                print(COL.yellow(msg)); return
         for k in effects:
             if k.startswith("device:"):
                 dev = k.split(":",1)[1]
-                if self.devices.get(dev, {}).get("owned", False):
+                if self.devices.get(dev, _EMPTY).get("owned", False):
                     print(COL.yellow(f"You already own {dev}.")); return
     
         # ---- 3) PRICE (after we know purchase is allowed) ----
         price = float(item.get("price", 0)) * qty
         if item.get("price", 0) >= 500:
-            price *= (1.0 - self.job_perks.get('shop_discount', 0.0))
+            price *= (1.0 - self.perks.shop_discount)
         if self.cash < price:
             print(COL.yellow(f"Not enough cash (${self.cash:,.2f}). This costs ${price:.0f}.")); return
     
@@ -1793,7 +2128,7 @@ class Game:
                 dev = eff_key.split(":",1)[1]
                 try:
                     amps = float(str(eff_val))
-                    self.devices.setdefault(dev, {})['amps'] = amps
+                    self.devices.setdefault(dev, {})['amps'] = amps; self._amps_dirty = True
                 except Exception:
                     pass
     
@@ -1837,27 +2172,25 @@ class Game:
     # ---------- Drivetrain Mode ----------
     def set_mode(self, mode):
         m = (mode or '').lower()
-        if m not in ('electric','fuel'): print(COL.red("MODE electric | MODE fuel")); return
+        if m not in DRIVE_MODES: print(COL.red("MODE electric | MODE fuel")); return
         self.mode = m; print(COL.green(f"Drivetrain set to {self.mode.upper()}."))
 
     def charge(self, method):
         method = (method or '').lower()
         if self.mode != 'electric': print(COL.yellow("You're not in electric mode. Switch with: MODE electric")); return
-        if method not in ('station','solar','wind','generator'): print(COL.yellow("CHARGE how? Options: station | solar | wind")); return
+        if method not in CHARGE_METHODS: print(COL.yellow("CHARGE how? Options: station | solar | wind")); return
+        node = self.node()
 
         if method == 'station':
-            node = self.node()
-            loc_resources = node.get('resources', {}) or {}.get('ev')
-            if not loc_resources['ev']: print(COL.yellow("No EV chargers here.")); return
+            if not (node.get('resources') or _EMPTY).get('ev'): print(COL.yellow("No EV chargers here.")); return
             hours = 1.0; add_pct = 30.0; cost = add_pct * 0.5
             if self.cash < cost: print(COL.grey(f"Charging costs ${cost:.0f}. You have ${self.cash:,.2f}.")); return
             self.cash -= cost; self.ev_battery = clamp(self.ev_battery + add_pct, 0, 100); self.advance(int(hours*60))
             print(COL.grey(f"Charged {add_pct:.0f}% at station in {hours:.1f}h. EV battery: {self.ev_battery:.0f}% | Cash ${self.cash:,.2f}."))
         elif method == 'solar':
             hours = 2.0
-            sol = (self.node().get('resources', {}) or {}).get('solar', 'fair')
-            site = {'excellent':1.0, 'good':0.75, 'fair':0.5, 'poor':0.25}.get(sol, 0.5)
-            uv_norm = clamp(derive_weather(self.node(), self.minutes)['uv'] / max(1.0, get_season(self.minutes)[1].get('uv_peak', 8.0)), 0, 1)
+            site = node['_solar_site']
+            uv_norm = uv_fraction(self.minutes)
             add_pct = (self.solar_watts / 1000.0) * 8.0 * site * uv_norm
             if add_pct <= 0.1: print(COL.yellow("You need solar panels installed to gain meaningful charge."))
             self.ev_battery = clamp(self.ev_battery + add_pct, 0, 100)
@@ -1906,8 +2239,8 @@ class Game:
                   + f". Fuel used {need:.2f} gal.")
         else:
             hours = 2.0
-            w = derive_weather(self.node(), self.minutes)
-            wind_factor = {'low':0.2,'medium':0.6,'high':1.0}[w['wind']]
+            w = self.weather()
+            wind_factor = WIND_EV[w.wind]
             add_pct = (self.wind_watts / 300.0) * 2.0 * wind_factor
             if add_pct <= 0.1: print(COL.yellow("You need a wind turbine (and some wind) to gain meaningful charge."))
             self.ev_battery = clamp(self.ev_battery + add_pct, 0, 100)
@@ -1918,8 +2251,7 @@ class Game:
     def refuel(self, gallons):
         node = self.node()
         if self.mode != 'fuel': print(COL.yellow("You're not in fuel mode. Switch with: MODE fuel")); return
-        loc_resources = node.get('resources', {}) or {}.get('gas')
-        if not loc_resources['gas']: print(COL.yellow("No fuel stations here.")); return
+        if not (node.get('resources') or _EMPTY).get('gas'): print(COL.yellow("No fuel stations here.")); return
         try: g = float(gallons)
         except Exception: print(COL.yellow("REFUEL <gallons>")); return
         if g <= 0: print(COL.yellow("That’s not how fuel works.")); return
@@ -1944,23 +2276,16 @@ class Game:
             self.pet_type = "dog"
         else:
             ## random selection otherwise
-            self.pet_type = random.choice(["dog","cat"])
+            self.pet_type = self._rng.choice(PET_KINDS)
 
-        ## dynamic dog generation (name + breed + spirit + action)
+        ## dynamic pet generation (name + breed + spirit + action)
+        rng = self._rng
+        breeds, names, spirits, actions = PET_TRAITS[self.pet_type]
+        breed, name, spirit, action = rng.choice(breeds), rng.choice(names), rng.choice(spirits), rng.choice(actions)
+        self.pet = Pet(name, breed); self.morale = clamp(self.morale + 10, 0, 100)
         if self.pet_type == "dog":
-            breed = random.choice(["French Bulldog","Golden Retriever","Labrador Retriever","Rottweiler","Beagle","Bulldog","Poodle","Dachsund","German Shorthair Pointer","German Shepherd","Shih Tzu","Terrier","Golden Doodle","Australian Sheepdog"])
-            name = random.choice(["Oreo","Mesa","Juniper","Pixel","Bowie","Zion","Havasu","Spot","Flash","The Dude","Max","Scooter"])
-            spirit = random.choice(["spirited","lazy","young","overweight","timid","large","small","playful","youthful","energetic"])
-            action = random.choice(["licks your face","claims your passenger seat","looks at you with big brown eyes","wags their tail","barks excitedly"])
-            self.pet = Pet(name, breed); self.morale = clamp(self.morale + 10, 0, 100)
             print(COL.grey(f"You meet {name}, a {spirit} {breed}, who walks up to you and {action}. Bond +10."))
-        ## dynamic cat generation (name + breed + spirit + action)
-        if self.pet_type == "cat":
-            breed = random.choice(["Siamese","Persian","Maine Coon","Ragdoll","Sphynx","American Shorthair","Burmese","British Shorthair","Longhair","Bobtail"])
-            name = random.choice(["Swazi","Whiskers","Patches","Satan","Grouchy Pants","Moo","Olaf","Chandler","Joey","Monica","Ross","Phoebe","Rachael"])
-            spirit = random.choice(["spirited","lazy","young","overweight","timid","large","small","playful","youthful","energetic"])
-            action = random.choice(["disappears into the back of your vehicle","makes their way onto the dash","winds between your legs","meows hungrily"])
-            self.pet = Pet(name, breed); self.morale = clamp(self.morale + 10, 0, 100)
+        else:
             print(COL.grey(f"You meet {name}, a {spirit} {breed} cat, who walks up to you and {action}. Bond +6."))
         xp = clamp(self.xp + 10, 0, 30)
         self.add_xp(int(xp), "pet adoption")
@@ -2013,8 +2338,7 @@ class Game:
             self.pet.guard_mode = False; self.pet.alert = clamp(self.pet.alert - 10, 0, 100)
             print(COL.grey(f"{self.pet.name} relaxes. Guard mode OFF."))
         elif v == 'SEARCH':
-            rng = seeded_rng(self.location, int(self.minutes/60), 'search')
-            if rng.random() < 0.4:
+            if mix_float(self.location, self.minutes // 60, 'search') < 0.4:
                 self.water = clamp(self.water + 1.0, 0, self.water_cap_gallons)
                 print(COL.green(f"{self.pet.name} finds fresh water. +1.0G water."))
                 xp = 20
@@ -2113,14 +2437,17 @@ def load_world():
     cand_yaml = os.path.join(here, "utah.yaml")
     cand_json = os.path.join(here, "utah.json")
     nodes = None
-    if os.path.exists(cand_yaml):
+    have_yaml, have_json = os.path.exists(cand_yaml), os.path.exists(cand_json)
+    # a utah.json at least as new as the YAML is taken as an export of it: skip YAML entirely
+    if have_json and (not have_yaml or os.path.getmtime(cand_json) >= os.path.getmtime(cand_yaml)):
+        with open(cand_json, "r", encoding="utf-8") as f:
+            nodes = json.load(f)["nodes"]
+    if nodes is None and have_yaml:
         try:
-            import yaml
-            with open(cand_yaml, "r", encoding="utf-8") as f:
-                nodes = yaml.safe_load(f)["nodes"]
+            nodes = load_yaml_cached(cand_yaml)["nodes"]
         except Exception as e:
             print(COL.red(f"YAML load failed: {e}. Falling back to JSON."))
-    if nodes is None and os.path.exists(cand_json):
+    if nodes is None and have_json:
         with open(cand_json, "r", encoding="utf-8") as f:
             nodes = json.load(f)["nodes"]
     if not nodes:
@@ -2130,39 +2457,238 @@ def load_world():
 
 def pick_from_dict(title, dct):
     print(COL.blue(title))
-    keys = list(dct.keys())
-    for i, k in enumerate(keys, 1):
-        lab = dct[k].get("label", k)
-        print(f"  {i}) {lab}")
+    keys = tuple(dct)  # built once; retries below only re-read input
+    print("\n".join(f"  {i}) {dct[k].get('label', k)}" for i, k in enumerate(keys, 1)))
     while True:
         ans = input(COL.prompt("> ")).strip().lower() or random.choice(keys)
-        if ans.isdigit():
-            idx = int(ans)-1
-            if 0 <= idx < len(keys): return keys[idx]
+        try: idx = int(ans)-1
+        except ValueError: idx = -1
+        if 0 <= idx < len(keys): return keys[idx]
         if ans in dct: return ans
         print(COL.red("Pick by number or key from the list above."))
 
+VEHICLE_NAMES  = ("Rocinante","Casper","River","Juniper","Sky","Ash","Indigo","Cedar","Rook","Raven")
+VEHICLE_COLORS = ("white","grey","yellow","green","red","blue","black","orange","purple","pink","beige")
+
 def character_creation():
     print(COL.blue("=== Character & Vehicle Setup ==="))
-    name = input(COL.prompt("Vehicle Name (enter to randomize): ")).strip()
-    if not name:
-        name = random.choice(["Rocinante","Casper","River","Juniper","Sky","Ash","Indigo","Cedar","Rook","Raven"])
-    color = input(COL.prompt("Vehicle color (enter to randomize): ")).strip() or random.choice(["white","grey","yellow","green","red","blue","black","orange","purple","pink","beige"])
+    name = input(COL.prompt("Vehicle Name (enter to randomize): ")).strip() or random.choice(VEHICLE_NAMES)
+    color = input(COL.prompt("Vehicle color (enter to randomize): ")).strip() or random.choice(VEHICLE_COLORS)
     vkey = pick_from_dict("Pick a vehicle type (enter to randomize):", VEHICLES)
     jkey = pick_from_dict("Pick a job (enter to randomize):", JOBS)
-    mode = ""
-    if vkey != "prius":
-        while mode not in ("electric", "fuel"):
-            mode = input(COL.prompt("Drivetrain [electric|fuel] (enter to randomize): ")).strip().lower() or random.choice(["electric","fuel"])
-    else:
-        mode = 'electric'
-    rng = seeded_rng(name, color, vkey, jkey, mode)
-    start_cash = rng.randint(1000, 5000)
+    mode = 'electric' if vkey == "prius" else ""
+    while mode not in DRIVE_MODES:  # blank randomizes; anything else unknown asks again
+        mode = input(COL.prompt("Drivetrain [electric|fuel] (enter to randomize): ")).strip().lower() or random.choice(("electric","fuel"))
+    start_cash = mix_int(1000, 5000, name, color, vkey, jkey, mode)
     cfg = {"name": name, "color": color, "vehicle_key": vkey, "job_key": jkey, "mode": mode, "start_cash": float(start_cash)}
     os.system('cls' if os.name == 'nt' else 'clear')
     print(COL.blue(f"Welcome, {name}. {color.title()} {VEHICLES[vkey]['label']} | {JOBS[jkey]['label']} | Start cash: {COL.green(f'${start_cash:,.2f}')}"))
     return cfg
 
+# ---- Command dispatch ----
+# Whole-line commands are looked up on the uppercased line (GAME_ACTIONS map
+# straight to Game methods); commands that take arguments are looked up on
+# their first word. Handlers get (game, line, tokens), tokens being
+# line.split() done once; returning False quits.
+
+def _cmd_look(game, line, tokens):
+    # Forms:
+    #   LOOK
+    #   LOOK NPC <who>
+    #   LOOK PET
+    #   LOOK ITEM <id>
+    #   LOOK VEHICLE
+    parts = line.split(maxsplit=2)
+    if game.in_local and (len(parts)==1 or parts[1].upper() in ('','HERE','AROUND')):
+        game.look_local()
+    elif len(parts) == 1 or parts[1].upper() in ('', 'AROUND', 'HERE'):
+        game.look()
+    else:
+        sub = parts[1].lower()
+        rest = line.split(' ', 2)[2] if len(parts) > 2 else ''
+        if sub in ('npc','person','people'):
+            game.look_npc(rest)
+        elif sub in ('pet','dog','cat'):
+            game.look_pet()
+        elif sub in ('item','items','gear'):
+            game.look_item(rest)
+        elif sub in ('vehicle','rig','van','bus','car'):
+            game.look_vehicle()
+        else:
+            # smart guess: try NPC by that token, then item, then fall back
+            token = sub if not rest else f"{sub} {rest}"
+            token = token.strip()
+            # NPC first
+            crew = game.npcs_here_now()
+            match = next((n for n in crew if n['id'].lower()==token.lower()
+                          or n['name'].lower()==token.lower()), None)
+            if match:
+                game.look_npc(token)
+            elif token.lower() == 'pet':
+                game.look_pet()
+            elif token.lower() in ('vehicle','rig'):
+                game.look_vehicle()
+            elif getattr(game, 'catalog', {}).get(token.lower()):
+                game.look_item(token)
+            else:
+                game.look()
+
+def _cmd_route(game, line, tokens):
+    parts = line.split(' ', 3)  # ROUTE TO [THE] <place>
+    if len(parts) < 3 or parts[1].upper() != 'TO': _cmd_unknown(game, line, tokens)
+    elif len(parts) == 4 and parts[2].upper() == 'THE': game.route_to(parts[3])
+    else: game.route_to(line.split(' ', 2)[2])
+
+def _cmd_camp(game, line, tokens):
+    game.camp(tokens[1] if len(tokens) > 1 else '')
+
+def _cmd_buy(game, line, tokens):
+    item = tokens[1] if len(tokens) > 1 else ''
+    game.buy(item, tokens[2] if len(tokens) > 2 else 1)
+
+def _cmd_charge(game, line, tokens):
+    game.charge(tokens[1] if len(tokens) > 1 else '')
+
+def _cmd_refuel(game, line, tokens):
+    game.refuel(tokens[1] if len(tokens) > 1 else '')
+
+def _cmd_talk(game, line, tokens):
+    who = line.split(' ', 1)[1].strip()
+    if not who:
+        print("Use: TALK <npc>")
+    else:
+        game.talk(who)
+
+def _cmd_ask(game, line, tokens):
+    who, topic = parse_ask_command(line)
+    if not who or not topic:
+        print("Use: ASK <npc> ABOUT <topic>")
+    else:
+        game.ask(who, topic)
+
+def _cmd_trade(game, line, tokens):
+    parts = line.split(maxsplit=1)
+    who = parts[1].strip() if len(parts) > 1 else ''
+    if not who:
+        print("Use: TRADE <npc>")
+    else:
+        game.trade(who)
+
+def _cmd_command_pet(game, line, tokens):
+    parts = line.split(' ', 2)  # COMMAND PET <verb>
+    if len(parts) < 2 or parts[1].upper() != 'PET': _cmd_unknown(game, line, tokens); return
+    game.command_pet(parts[2] if len(parts) > 2 else '')
+
+def _cmd_work(game, line, tokens):
+    kind  = tokens[1] if len(tokens)>1 and tokens[1].lower() not in ('1','2','3','4','5','6') else ''
+    hours = tokens[2] if len(tokens)>2 else (tokens[1] if len(tokens)>1 and tokens[1].isdigit() else None)
+    game.work(kind, hours)
+
+def _cmd_turn(game, line, tokens):
+    if len(tokens) >= 3: game.toggle_device(tokens[1], tokens[2])
+    else: print("TURN <device> <on|off>")
+
+def _cmd_help(game, line, tokens):
+    print(COL.grey(HELP_TEXT))
+
+def _cmd_move(game, line, tokens):
+    game.move_dir(line.lower())
+
+def _cmd_mode(game, line, tokens):
+    game.set_mode(line.split(' ', 1)[1])
+
+def _cmd_watch(game, line, tokens):
+    game.watch_something(line.split(' ', 1)[1])
+
+def _cmd_quit(game, line, tokens):
+    print("You turn off the vehicle and end the adventure. Bye."); return False
+
+def _cmd_unknown(game, line, tokens):
+    print(COL.red("Unknown command. Type HELP."))
+
+# Whole-line commands that need nothing but the game: plain Game methods
+GAME_ACTIONS = {
+    'EXITS': Game.list_exits,
+    'EXPLORE': Game.enter_map, 'ENTER MAP': Game.enter_map,  # auto-picks the map tied to this overworld node
+    'STATUS': Game.status, 'STATS': Game.status,
+    'MAP': Game.show_map, 'DRIVE': Game.drive, 'WEATHER': Game.check_weather,
+    'COOK': Game.cook, 'EAT': Game.cook, 'NAP': Game.sleep, 'HIKE': Game.hike, 'SHOP': Game.shop,
+    'PEOPLE': Game.people,
+    'ADOPT PET': Game.adopt_pet, 'FEED PET': Game.feed_pet, 'WATER PET': Game.water_pet,
+    'WALK PET': Game.walk_pet, 'WASH PET': Game.wash_pet, 'PLAY WITH PET': Game.play_with_pet,
+    'DEVICES': Game.devices_panel, 'ELECTRICAL': Game.electrical_panel, 'POWER': Game.electrical_panel,
+    'BATTERY': Game.battery_status, 'EXP': Game.exp, 'ELEVATION': Game.elevation,
+    'INVENTORY': Game.inventory, 'INV': Game.inventory, 'I': Game.inventory,
+    'CASH': Game.bank, 'BANK': Game.bank, 'MONEY': Game.bank,
+    'SOLAR': Game.solar_power_status, 'WIND': Game.wind_power_status,
+    'EV': Game.ev_status, 'FUEL': Game.fuel_status, 'TIME': Game.report_time,
+    'READ': Game.read_book, 'MORALE': Game.report_morale, 'ENERGY': Game.report_energy,
+    'PET': Game.report_pet_status,
+    'STARLINK': Game.manage_starlink, 'WEBOOST': Game.manage_weboost, 'FRIDGE': Game.manage_fridge,
+    'HEATER': Game.manage_heater, 'LAPTOP': Game.manage_laptop, 'GENERATOR': Game.manage_generator,
+    'GOALS': Game.share_goals,
+    'LEAVE': Game.leave_map, 'LEAVE CAR': Game.leave_map, 'EXIT CAR': Game.leave_map,
+    'EXIT VEHICLE': Game.leave_map, 'PARK CAR': Game.leave_map,
+}
+
+# Whole-line commands that need the line or its tokens
+COMMANDS = {
+    'HELP': _cmd_help, '?': _cmd_help,
+    'LOOK': _cmd_look, 'CAMP': _cmd_camp, 'CHARGE': _cmd_charge, 'REFUEL': _cmd_refuel,
+    'TRADE': _cmd_trade, 'COMMAND PET': _cmd_command_pet, 'WORK': _cmd_work, 'TURN': _cmd_turn,
+    'QUIT': _cmd_quit, 'EXIT': _cmd_quit,
+}
+# Single-word compass moves
+for _d in ("N","NORTH","S","SOUTH","E","EAST","W","WEST","NE","NORTHEAST","NW","NORTHWEST","SE","SOUTHEAST","SW","SOUTHWEST"):
+    COMMANDS[_d] = _cmd_move
+
+# First word -> handler, for lines with arguments ("BUY water 2")
+VERB_COMMANDS = {
+    'LOOK': _cmd_look, 'ROUTE': _cmd_route, 'CAMP': _cmd_camp, 'BUY': _cmd_buy, 'MODE': _cmd_mode,
+    'CHARGE': _cmd_charge, 'REFUEL': _cmd_refuel, 'TALK': _cmd_talk, 'ASK': _cmd_ask,
+    'TRADE': _cmd_trade, 'COMMAND': _cmd_command_pet, 'WORK': _cmd_work, 'TURN': _cmd_turn,
+    'WATCH': _cmd_watch,
+}
+
+def handle_command(game, line):
+    """Run one non-empty command line against game; returns False on QUIT."""
+    u = line.upper()
+    action = GAME_ACTIONS.get(u)
+    if action is not None:
+        action(game); return True
+    handler = COMMANDS.get(u)
+    if handler is None:
+        verb, sep, _ = u.partition(' ')
+        handler = (VERB_COMMANDS.get(verb) if sep else None) or _cmd_unknown
+    return handler(game, line, line.split()) is not False
+
+# ---------------------------- Line editing ----------------------------
+HISTORY_FILE = os.path.expanduser("~/.nomad_history")
+_ANSI_RE = re.compile(r"(\033\[[0-9;]*m)")
+
+def setup_readline():
+    """Arrow-key history (kept in HISTORY_FILE) and TAB completion of command words.
+    Returns False when readline isn't available; input() then works as before."""
+    try:
+        import readline, atexit
+    except ImportError:
+        return False
+    try: readline.read_history_file(HISTORY_FILE)
+    except OSError: pass
+    readline.set_history_length(1000)
+    atexit.register(readline.write_history_file, HISTORY_FILE)
+    words = sorted({k.split()[0] for k in (*GAME_ACTIONS, *COMMANDS, *VERB_COMMANDS)})
+    def complete(text, state):
+        hits = [w for w in words if w.startswith(text.upper())]
+        return hits[state] if state < len(hits) else None
+    readline.set_completer(complete)
+    readline.parse_and_bind("tab: complete")
+    return True
+
+def readline_prompt(s):
+    """Mark colour escapes as zero-width so readline measures the prompt correctly."""
+    return _ANSI_RE.sub("\001\\1\002", s)
+
 def main():
     world = load_world()
     catalog = load_items_catalog()
@@ -2179,7 +2705,10 @@ def main():
     input(COL.blue("Press ENTER to continue..."))
     os.system('cls' if os.name == 'nt' else 'clear')
 
+    seed = random.getrandbits(64)
+    set_draw_seed(seed)  # start cash is drawn during character creation
     cfg = character_creation()
+    cfg["seed"] = seed
     local_maps = load_local_maps("data/maps")
     game = Game(world, cfg, catalog, npcs=npcs)
 
@@ -2188,171 +2717,92 @@ def main():
     game._check_for_truck_camper()
     print("Type HELP for commands.\n")
 
+    edit = setup_readline()
     while True:
         try:
-            line = input(make_cli_prompt(game)).strip()
+            prompt = make_cli_prompt(game)
+            line = input(readline_prompt(prompt) if edit else prompt).strip()
         except (EOFError, KeyboardInterrupt):
             print("\nGood roads and tailwinds."); break
         if not line: continue
-        u = line.upper()
-
-        if u in ('HELP','?'): print(COL.grey(HELP_TEXT))
-
-        # Single-word compass moves
-        if u in ("N","NORTH","S","SOUTH","E","EAST","W","WEST","NE","NORTHEAST","NW","NORTHWEST","SE","SOUTHEAST","SW","SOUTHWEST"):
-            game.move_dir(u.lower()); continue
-        
-        #elif u.startswith("GO "):
-        #    parts = line.split()
-        #    if len(parts) >= 2:
-        #        game.move_dir(parts[1])
-        #    else:
-        #        print("GO which way? n/s/e/w/ne/nw/se/sw")
-        #    continue
-        
-        elif u in ("EXITS",):
-            game.list_exits(); continue
-        
-        elif u in ("EXPLORE","ENTER MAP"):
-            game.enter_map()  # auto-picks the map tied to this overworld node
-            continue
-        
-        elif u in ("LEAVE","LEAVE CAR","EXIT CAR","EXIT VEHICLE","PARK CAR"):
-            game.leave_map(); continue
-        elif u.startswith('LOOK'):
-            # Forms:
-            #   LOOK
-            #   LOOK NPC <who>
-            #   LOOK PET
-            #   LOOK ITEM <id>
-            #   LOOK VEHICLE
-            #parts = line.split()
-            parts = line.split(maxsplit=2)
-            if game.in_local and (len(parts)==1 or parts[1].upper() in ('','HERE','AROUND')):
-                game.look_local()
-            elif len(parts) == 1 or parts[1].upper() in ('', 'AROUND', 'HERE'):
-                game.look()
-            else:
-                sub = parts[1].lower()
-                rest = line.split(' ', 2)[2] if len(parts) > 2 else ''
-                if sub in ('npc','person','people'):
-                    game.look_npc(rest)
-                elif sub in ('pet','dog','cat'):
-                    game.look_pet()
-                elif sub in ('item','items','gear'):
-                    game.look_item(rest)
-                elif sub in ('vehicle','rig','van','bus','car'):
-                    game.look_vehicle()
-                else:
-                    # smart guess: try NPC by that token, then item, then fall back
-                    token = sub if not rest else f"{sub} {rest}"
-                    token = token.strip()
-                    # NPC first
-                    crew = game.npcs_here_now()
-                    match = next((n for n in crew if n['id'].lower()==token.lower()
-                                  or n['name'].lower()==token.lower()), None)
-                    if match:
-                        game.look_npc(token)
-                    elif token.lower() == 'pet':
-                        game.look_pet()
-                    elif token.lower() in ('vehicle','rig'):
-                        game.look_vehicle()
-                    elif getattr(game, 'catalog', {}).get(token.lower()):
-                        game.look_item(token)
-                    else:
-                        game.look()
-        elif u in ('STATUS','STATS'): game.status()
-        elif u == 'MAP': game.show_map()
-        elif u.startswith('ROUTE TO THE '): game.route_to(line.split(' ', 3)[3])
-        elif u.startswith('ROUTE TO '): game.route_to(line.split(' ', 2)[2])
-        elif u == 'DRIVE': game.drive()
-        elif u == 'WEATHER': game.check_weather()
-        elif u.startswith('CAMP'):
-            parts = line.split(); style = parts[1] if len(parts)>1 else ''
-            game.camp(style)
-        elif u in ('COOK','EAT'): game.cook()
-        elif u == 'NAP': game.sleep()
-        elif u == 'HIKE': game.hike()
-        elif u == 'SHOP': game.shop()
-        elif u.startswith('BUY '):
-            parts = line.split(); item = parts[1] if len(parts) > 1 else ''
-            qty  = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 1
-            game.buy(item, qty)
-        elif u.startswith('MODE '): game.set_mode(line.split(' ', 1)[1])
-        elif u.startswith('CHARGE'):
-            parts = line.split(); method = parts[1] if len(parts) > 1 else ''
-            game.charge(method)
-        elif u.startswith('REFUEL'):
-            parts = line.split(); gallons = parts[1] if len(parts) > 1 else ''
-            game.refuel(gallons)
-        elif u == 'PEOPLE':
-            game.people()
-        elif u.startswith('TALK '):
-            who = line.split(' ', 1)[1].strip()
-            if not who:
-                print("Use: TALK <npc>")
-            else:
-                game.talk(who)
-        elif u.startswith('ASK '):
-            who, topic = parse_ask_command(line)
-            if not who or not topic:
-                print("Use: ASK <npc> ABOUT <topic>")
-            else:
-                game.ask(who, topic)
-        elif u.startswith('TRADE'):
-            parts = line.split(maxsplit=1)
-            who = parts[1].strip() if len(parts) > 1 else ''
-            if not who:
-                print("Use: TRADE <npc>")
-            else:
-                game.trade(who)
-        elif u == 'ADOPT PET': game.adopt_pet()
-        elif u == "FEED PET": game.feed_pet()
-        elif u == 'WATER PET': game.water_pet()
-        elif u == 'WALK PET': game.walk_pet()
-        elif u == 'WASH PET': game.wash_pet()
-        elif u == 'PLAY WITH PET': game.play_with_pet()
-        elif u.startswith('COMMAND PET'):
-            verb = line.split(' ', 2)[2] if len(line.split(' ', 2))>2 else ''
-            game.command_pet(verb)
-        elif u in ('QUIT','EXIT'):
-            print("You turn off the vehicle and end the adventure. Bye."); break
-        elif u.startswith('WORK'):
-            parts = line.split()
-            kind  = parts[1] if len(parts)>1 and parts[1].lower() not in ('1','2','3','4','5','6') else ''
-            hours = parts[2] if len(parts)>2 else (parts[1] if len(parts)>1 and parts[1].isdigit() else None)
-            game.work(kind, hours)
-        elif u == 'DEVICES': game.devices_panel()
-        elif u.startswith('TURN'):
-            parts = line.split()
-            if len(parts) >= 3: game.toggle_device(parts[1], parts[2])
-            else: print("TURN <device> <on|off>")
-        elif u in ('ELECTRICAL','POWER'): game.electrical_panel()
-        elif u == 'BATTERY': game.battery_status()
-        elif u == 'EXP': game.exp()
-        elif u == 'ELEVATION': game.elevation()
-        elif u in ('INVENTORY','INV','I'): game.inventory()
-        elif u in ('CASH','BANK','MONEY'): game.bank()
-        elif u == "SOLAR": game.solar_power_status()
-        elif u == "WIND": game.wind_power_status()
-        elif u == "EV": game.ev_status()
-        elif u == "FUEL": game.fuel_status()
-        elif u == "TIME": game.report_time()
-        elif u == "READ": game.read_book()
-        elif u == "PEOPLE": game.people()
-        elif u == "MORALE": game.report_morale()
-        elif u == "ENERGY": game.report_energy()
-        elif u == "PET": game.report_pet_status()
-        elif u == "STARLINK": game.manage_starlink()
-        elif u == "WEBOOST": game.manage_weboost()
-        elif u == "FRIDGE": game.manage_fridge()
-        elif u == "HEATER": game.manage_heater()
-        elif u == "LAPTOP": game.manage_laptop()
-        elif u == "GENERATOR": game.manage_generator()
-        elif u == "GOALS": game.share_goals()
-        elif u.startswith('WATCH '): game.watch_something(line.split(' ', 1)[1])
-        else:
-            print(COL.red("Unknown command. Type HELP."))
+        if not handle_command(game, line): break
+
+# ---------------------------- Headless / batch ------------------------
+_HEADLESS_DATA = None  # (world, catalog, npcs), loaded once per process
+
+def _headless_data():
+    """World, item catalog and NPCs for headless runs, loaded once per process.
+    Games only read them, and each Game drops the world's seed-dependent route cache."""
+    global _HEADLESS_DATA
+    if _HEADLESS_DATA is None:
+        _HEADLESS_DATA = (load_world(), load_items_catalog(), load_npcs())
+    return _HEADLESS_DATA
+
+def run_headless(seed, config=None, max_days=None):
+    """Play one seeded game from config['commands'] with output discarded.
+    Top-level and picklable so run_batch can fan seeds out across processes."""
+    config = config or {}
+    random.seed(seed)
+    vkey = config.get("vehicle_key") or random.choice(list(VEHICLES))
+    mode = config.get("mode") or ('electric' if vkey == 'prius' else random.choice(["electric","fuel"]))
+    cfg = {"name": config.get("name", f"run{seed}"), "color": config.get("color", "white"),
+           "vehicle_key": vkey, "job_key": config.get("job_key") or random.choice(list(JOBS)),
+           "mode": mode, "start_cash": float(config.get("start_cash") or random.randint(1000, 5000)),
+           "interactive": False, "seed": seed}
+    with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+        world, catalog, npcs = _headless_data()
+        game = Game(world, cfg, catalog, npcs=npcs)
+        for line in config.get("commands", []):
+            if max_days and game.minutes >= max_days * DAY_MINUTES: break
+            line = line.strip()
+            if line and not handle_command(game, line): break
+    return {"seed": seed, "vehicle": vkey, "job": cfg["job_key"], "mode": mode,
+            "day": game.minutes // DAY_MINUTES + 1, "location": game.location,
+            "cash": round(game.cash, 2), "xp": game.xp, "level": game.level,
+            "battery": round(game.battery, 1), "energy": round(game.energy, 1), "morale": round(game.morale, 1)}
+
+def run_batch(n, config=None, first_seed=1, max_days=None):
+    """n independent replications (seeds first_seed..), one process per core."""
+    from concurrent.futures import ProcessPoolExecutor
+    seeds = range(first_seed, first_seed + n)
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_headless_data) as ex:
+        return list(ex.map(run_headless, seeds, [config]*n, [max_days]*n))
+
+def check_reproducible(config=None, seed=1, max_days=None):
+    """Run one seed in two fresh interpreters with different str-hash salts;
+    returns (same, lines). Guards batch results against per-process state."""
+    import tempfile
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(config or {}, f)
+    cmd = [sys.executable, os.path.abspath(__file__), "--batch", "1", "--seed", str(seed), "--config", f.name]
+    if max_days: cmd += ["--max-days", str(max_days)]
+    try:
+        lines = [subprocess.run(cmd, capture_output=True, text=True, check=True,
+                                env={**os.environ, "PYTHONHASHSEED": str(salt)}).stdout.strip() for salt in (1, 2)]
+    finally:
+        os.unlink(f.name)
+    return lines[0] == lines[1], lines
 
 if __name__ == "__main__":
-    main()
+    if '--batch' in sys.argv:
+        import argparse
+        ap = argparse.ArgumentParser(description="Headless batch runs for balancing; one JSON line per seed.")
+        ap.add_argument('--batch', type=int, required=True, help="number of replications")
+        ap.add_argument('--config', help="JSON file: optional vehicle_key/job_key/mode/start_cash and a 'commands' list")
+        ap.add_argument('--seed', type=int, default=1, help="first seed")
+        ap.add_argument('--max-days', type=int, default=None)
+        ap.add_argument('--check-repro', action='store_true', help="first rerun --seed in two fresh processes; exit 1 if they differ")
+        args = ap.parse_args()
+        cfg = {}
+        if args.config:
+            with open(args.config, "r", encoding="utf-8") as f:
+                cfg = json.load(f)
+        if args.check_repro:
+            same, lines = check_reproducible(cfg, args.seed, args.max_days)
+            if not same:
+                print(COL.red(f"Seed {args.seed} is not reproducible across processes:"), *lines, sep="\n", file=sys.stderr)
+                sys.exit(1)
+        for r in run_batch(args.batch, cfg, args.seed, args.max_days):
+            print(json.dumps(r))
+    else:
+        main()